@@ -11,6 +11,8 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 import voluptuous as vol
 
@@ -28,7 +30,7 @@ from .const import (
 )
 from .coordinator import SmartIrrigationCoordinator
 from .ai.irrigation_model import IrrigationAIModel
-from .scheduling.scheduler import SmartScheduler
+from .scheduling.scheduler import SmartScheduler, async_remove_scheduler_store
 from .rachio.ha_controller import HAZoneController
 from .panel import async_register_panel, async_unregister_panel, async_setup_panel_url
 
@@ -59,6 +61,46 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     return True
 
 
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate an old config entry to the current version."""
+    if entry.version == 1:
+        # Version 2 replaces the zone water deficit sensors with the
+        # depletion_percent attribute of the zone duration sensors
+        registry = er.async_get(hass)
+        removed = [
+            registry_entry.entity_id
+            for registry_entry in er.async_entries_for_config_entry(
+                registry, entry.entry_id
+            )
+            if registry_entry.domain == "sensor"
+            and registry_entry.unique_id.endswith("_deficit")
+        ]
+        for entity_id in removed:
+            registry.async_remove(entity_id)
+
+        if removed:
+            _LOGGER.warning(
+                "Removed zone water deficit sensors %s; the deficit is now the "
+                "depletion_percent attribute of each zone duration sensor",
+                ", ".join(removed),
+            )
+            ir.async_create_issue(
+                hass,
+                DOMAIN,
+                f"deficit_sensors_removed_{entry.entry_id}",
+                is_fixable=False,
+                is_persistent=True,
+                severity=ir.IssueSeverity.WARNING,
+                translation_key="deficit_sensors_removed",
+                translation_placeholders={"entities": ", ".join(removed)},
+            )
+
+        hass.config_entries.async_update_entry(entry, version=2)
+        _LOGGER.info("Migrated Smart Irrigation AI config entry to version 2")
+
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Smart Irrigation AI from a config entry."""
     hass.data.setdefault(DOMAIN, {})
@@ -69,6 +111,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Use Home Assistant's Rachio integration
     controller = HAZoneController(hass)
+    controller.async_setup_listeners()
+    entry.async_on_unload(controller.async_shutdown)
 
     # Retry zone discovery with delays to handle startup race conditions
     # The Rachio integration may not be fully loaded yet
@@ -118,6 +162,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         rachio_api=controller,
         ai_model=ai_model,
         use_ha_rachio=True,
+        entry_id=entry.entry_id,
     )
 
     # Create coordinator
@@ -195,6 +240,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove persisted data when a config entry is deleted."""
+    await async_remove_scheduler_store(hass, entry.entry_id)
+    ir.async_delete_issue(hass, DOMAIN, f"deficit_sensors_removed_{entry.entry_id}")
+
+
 async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -348,7 +399,6 @@ async def websocket_get_history(
 
         scheduler = data.get("scheduler")
         if scheduler:
-            history = scheduler.get_run_history()
-            result["history"].extend(history)
+            result["history"].extend(scheduler.get_run_history())
 
     connection.send_result(msg["id"], result)
@@ -6,6 +6,7 @@ from datetime import datetime, date, timedelta, time
 from typing import Any
 
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 
 from .evapotranspiration import EvapotranspirationCalculator, ETTracker
 from .weather_processor import WeatherProcessor
@@ -94,13 +95,11 @@ class IrrigationAIModel:
         self._last_recommendations: dict[str, WateringRecommendation] = {}
         self._last_calculation: datetime | None = None
 
-    def _parse_time(self, time_str: str) -> time:
-        """Parse time string to time object."""
-        try:
-            parts = time_str.split(":")
-            return time(int(parts[0]), int(parts[1]), int(parts[2]) if len(parts) > 2 else 0)
-        except (ValueError, IndexError):
-            return time(5, 0)  # Default
+    @staticmethod
+    def _parse_time(time_str: str) -> time:
+        """Parse an HH:MM or HH:MM:SS string to a time object."""
+        parsed = dt_util.parse_time(time_str) if time_str else None
+        return parsed if parsed is not None else time(5, 0)  # Default
 
     def _initialize_zones(self) -> None:
         """Initialize zone configurations and trackers."""
@@ -476,7 +475,19 @@ class IrrigationAIModel:
             Optimized schedule as list of zone operations
         """
         recommendations = await self.async_get_all_recommendations()
+        return self.build_schedule_from_recommendations(recommendations)
+
+    def build_schedule_from_recommendations(
+        self, recommendations: dict[str, WateringRecommendation]
+    ) -> list[dict[str, Any]]:
+        """Build an optimized schedule from already computed recommendations.
+
+        Args:
+            recommendations: zone_id -> WateringRecommendation
 
+        Returns:
+            Optimized schedule as list of zone operations
+        """
         # Get zone analyses for prioritization
         zone_analyses = self.soil_analyzer.get_all_zones_analysis()
 
@@ -503,6 +514,20 @@ class IrrigationAIModel:
         """Get zone configuration."""
         return self._zone_configs.get(zone_id)
 
+    def set_zone_option(self, zone_id: str, option: str, value: Any) -> None:
+        """Update a single field of a zone's configuration.
+
+        Args:
+            zone_id: Zone to update; unknown zones are ignored
+            option: ZoneConfig field name, e.g. "soil_type"
+            value: New value for the field
+        """
+        zone_config = self._zone_configs.get(zone_id)
+        if zone_config is None:
+            return
+
+        setattr(zone_config, option, value)
+
     def get_model_status(self) -> dict[str, Any]:
         """Get overall model status."""
         return {
@@ -158,7 +158,7 @@ class ZoneOptimizer:
             total_duration: Total watering time needed in minutes
 
         Returns:
-            List of {cycle: minutes, soak: minutes} dicts
+            List of {cycle: minutes, soak: minutes, cycle_seconds: seconds} dicts
         """
         if total_duration <= 0:
             return []
@@ -187,6 +187,7 @@ class ZoneOptimizer:
                 cycles.append({
                     "cycle": cycle_duration,
                     "soak": soak_time if remaining > cycle_duration else 0,
+                    "cycle_seconds": cycle_duration * 60,
                 })
                 remaining -= cycle_duration
 
@@ -194,7 +195,7 @@ class ZoneOptimizer:
 
         else:
             # No runoff risk - single cycle
-            return [{"cycle": total_duration, "soak": 0}]
+            return [{"cycle": total_duration, "soak": 0, "cycle_seconds": total_duration * 60}]
 
     def optimize_schedule(
         self,
@@ -252,6 +253,7 @@ class ZoneOptimizer:
                 "zone_id": rec.zone_id,
                 "zone_name": rec.zone_name,
                 "duration_minutes": adjusted_duration,
+                "duration_seconds": adjusted_duration * 60,
                 "water_amount_inches": rec.water_amount_inches * (adjusted_duration / rec.duration_minutes) if rec.duration_minutes > 0 else 0,
                 "priority": rec.priority,
                 "confidence": rec.confidence,
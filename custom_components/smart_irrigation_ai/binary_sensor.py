@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from typing import Any
 
 from homeassistant.components.binary_sensor import (
@@ -10,11 +11,12 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, EMPTY_MAPPING
+from .coordinator import EMPTY_ZONE_DATA
+from .entity import SkipUnchangedMixin, device_info_for
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -54,7 +56,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class SmartIrrigationBinarySensorBase(CoordinatorEntity, BinarySensorEntity):
+class SmartIrrigationBinarySensorBase(SkipUnchangedMixin, CoordinatorEntity, BinarySensorEntity):
     """Base class for Smart Irrigation binary sensors."""
 
     def __init__(
@@ -70,27 +72,18 @@ class SmartIrrigationBinarySensorBase(CoordinatorEntity, BinarySensorEntity):
         self._sensor_type = sensor_type
         self._attr_name = f"Smart Irrigation {name}"
         self._attr_unique_id = f"{entry.entry_id}_{sensor_type}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name="Smart Irrigation AI Controller",
-            manufacturer="Smart Irrigation AI",
-            model="AI Irrigation Controller",
-            sw_version="1.0.0",
-        )
+        self._attr_device_info = device_info_for(entry)
 
 
 class IrrigationRunningSensor(SmartIrrigationBinarySensorBase):
     """Binary sensor for irrigation running status."""
 
+    _attr_device_class = BinarySensorDeviceClass.RUNNING
+    _attr_icon = "mdi:sprinkler"
+
     def __init__(self, coordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "running", "Running")
-        self._attr_device_class = BinarySensorDeviceClass.RUNNING
-        self._attr_icon = "mdi:sprinkler"
 
     @property
     def is_on(self) -> bool:
@@ -102,10 +95,10 @@ class IrrigationRunningSensor(SmartIrrigationBinarySensorBase):
         return schedule.get("is_running", False)
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return additional attributes."""
         if self.coordinator.data is None:
-            return {}
+            return EMPTY_MAPPING
 
         schedule = self.coordinator.data.get("schedule", {})
         return {
@@ -116,11 +109,12 @@ class IrrigationRunningSensor(SmartIrrigationBinarySensorBase):
 class RainSensorTrippedSensor(SmartIrrigationBinarySensorBase):
     """Binary sensor for rain sensor status."""
 
+    _attr_device_class = BinarySensorDeviceClass.MOISTURE
+    _attr_icon = "mdi:weather-rainy"
+
     def __init__(self, coordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "rain_sensor", "Rain Detected")
-        self._attr_device_class = BinarySensorDeviceClass.MOISTURE
-        self._attr_icon = "mdi:weather-rainy"
 
     @property
     def is_on(self) -> bool:
@@ -132,10 +126,10 @@ class RainSensorTrippedSensor(SmartIrrigationBinarySensorBase):
         return rain_sensor.get("tripped", False) or rain_sensor.get("is_raining", False)
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return additional attributes."""
         if self.coordinator.data is None:
-            return {}
+            return EMPTY_MAPPING
 
         rain_sensor = self.coordinator.data.get("rain_sensor", {})
         return {
@@ -149,10 +143,11 @@ class RainSensorTrippedSensor(SmartIrrigationBinarySensorBase):
 class WateringNeededSensor(SmartIrrigationBinarySensorBase):
     """Binary sensor indicating if any zone needs water."""
 
+    _attr_icon = "mdi:water-alert"
+
     def __init__(self, coordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "watering_needed", "Watering Needed")
-        self._attr_icon = "mdi:water-alert"
 
     @property
     def is_on(self) -> bool:
@@ -162,26 +157,26 @@ class WateringNeededSensor(SmartIrrigationBinarySensorBase):
 
         recommendations = self.coordinator.data.get("recommendations", {})
         return any(
-            hasattr(r, 'should_water') and r.should_water
+            r.should_water
             for r in recommendations.values()
         )
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return additional attributes."""
         if self.coordinator.data is None:
-            return {}
+            return EMPTY_MAPPING
 
         recommendations = self.coordinator.data.get("recommendations", {})
         zones_needing = []
 
         for zone_id, rec in recommendations.items():
-            if hasattr(rec, 'should_water') and rec.should_water:
+            if rec.should_water:
                 zones_needing.append({
                     "zone_id": zone_id,
-                    "zone_name": rec.zone_name if hasattr(rec, 'zone_name') else zone_id,
-                    "duration": rec.duration_minutes if hasattr(rec, 'duration_minutes') else 0,
-                    "urgency": rec.factors.get("soil_analysis", {}).get("urgency") if hasattr(rec, 'factors') else None,
+                    "zone_name": rec.zone_name,
+                    "duration": rec.duration_minutes,
+                    "urgency": rec.factors.get("soil_analysis", {}).get("urgency"),
                 })
 
         return {
@@ -193,10 +188,11 @@ class WateringNeededSensor(SmartIrrigationBinarySensorBase):
 class WeatherSkipSensor(SmartIrrigationBinarySensorBase):
     """Binary sensor indicating if weather is causing a skip."""
 
+    _attr_icon = "mdi:weather-cloudy-alert"
+
     def __init__(self, coordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "weather_skip", "Weather Skip Active")
-        self._attr_icon = "mdi:weather-cloudy-alert"
 
     @property
     def is_on(self) -> bool:
@@ -207,10 +203,8 @@ class WeatherSkipSensor(SmartIrrigationBinarySensorBase):
         recommendations = self.coordinator.data.get("recommendations", {})
 
         for rec in recommendations.values():
-            if hasattr(rec, 'factors'):
-                weather_factor = rec.factors.get("weather_factor", 1.0)
-                if weather_factor < 0.3:
-                    return True
+            if rec.factors.get("weather_factor", 1.0) < 0.3:
+                return True
 
         weather = self.coordinator.data.get("weather", {})
         condition = weather.get("condition", "").lower()
@@ -220,10 +214,10 @@ class WeatherSkipSensor(SmartIrrigationBinarySensorBase):
         return False
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return additional attributes."""
         if self.coordinator.data is None:
-            return {}
+            return EMPTY_MAPPING
 
         weather = self.coordinator.data.get("weather", {})
         rain_sensor = self.coordinator.data.get("rain_sensor", {})
@@ -238,14 +232,14 @@ class WeatherSkipSensor(SmartIrrigationBinarySensorBase):
 
         recommendations = self.coordinator.data.get("recommendations", {})
         for rec in recommendations.values():
-            if hasattr(rec, 'skip_reason') and rec.skip_reason:
+            if rec.skip_reason:
                 if rec.skip_reason not in skip_reasons:
                     skip_reasons.append(rec.skip_reason)
                 break
 
         return {
             "weather_condition": weather.get("condition"),
-            "weather_factor": recommendations.get(list(recommendations.keys())[0], {}).factors.get("weather_factor") if recommendations else None,
+            "weather_factor": self.coordinator.data.get("sample_factors", {}).get("weather_factor"),
             "skip_reasons": skip_reasons,
         }
 
@@ -253,6 +247,8 @@ class WeatherSkipSensor(SmartIrrigationBinarySensorBase):
 class ZoneNeedsWaterSensor(SmartIrrigationBinarySensorBase):
     """Binary sensor for zone water need."""
 
+    _attr_icon = "mdi:water-alert"
+
     def __init__(
         self,
         coordinator,
@@ -269,7 +265,6 @@ class ZoneNeedsWaterSensor(SmartIrrigationBinarySensorBase):
         )
         self._zone_id = zone_id
         self._zone_name = zone_name
-        self._attr_icon = "mdi:water-alert"
 
     @property
     def is_on(self) -> bool:
@@ -277,24 +272,28 @@ class ZoneNeedsWaterSensor(SmartIrrigationBinarySensorBase):
         if self.coordinator.data is None:
             return False
 
-        recommendations = self.coordinator.data.get("recommendations", {})
-        rec = recommendations.get(self._zone_id)
+        zone = self.coordinator.data.get("by_zone", {}).get(
+            self._zone_id, EMPTY_ZONE_DATA
+        )
+        rec = zone["recommendation"]
 
-        if rec and hasattr(rec, 'should_water'):
+        if rec is not None:
             return rec.should_water
 
         return False
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return additional attributes."""
         if self.coordinator.data is None:
-            return {}
+            return EMPTY_MAPPING
 
-        recommendations = self.coordinator.data.get("recommendations", {})
-        rec = recommendations.get(self._zone_id)
+        zone = self.coordinator.data.get("by_zone", {}).get(
+            self._zone_id, EMPTY_ZONE_DATA
+        )
+        rec = zone["recommendation"]
 
-        if rec and hasattr(rec, 'factors'):
+        if rec is not None:
             return {
                 "recommended_duration": rec.duration_minutes,
                 "water_amount_inches": rec.water_amount_inches,
@@ -303,12 +302,15 @@ class ZoneNeedsWaterSensor(SmartIrrigationBinarySensorBase):
                 "skip_reason": rec.skip_reason,
             }
 
-        return {}
+        return EMPTY_MAPPING
 
 
 class ZoneRunningSensor(SmartIrrigationBinarySensorBase):
     """Binary sensor for zone running status."""
 
+    _attr_device_class = BinarySensorDeviceClass.RUNNING
+    _attr_icon = "mdi:sprinkler-variant"
+
     def __init__(
         self,
         coordinator,
@@ -325,8 +327,6 @@ class ZoneRunningSensor(SmartIrrigationBinarySensorBase):
         )
         self._zone_id = zone_id
         self._zone_name = zone_name
-        self._attr_device_class = BinarySensorDeviceClass.RUNNING
-        self._attr_icon = "mdi:sprinkler-variant"
 
     @property
     def is_on(self) -> bool:
@@ -334,19 +334,23 @@ class ZoneRunningSensor(SmartIrrigationBinarySensorBase):
         if self.coordinator.data is None:
             return False
 
-        zones = self.coordinator.data.get("zones", {})
-        zone_status = zones.get(self._zone_id, {})
+        zone = self.coordinator.data.get("by_zone", {}).get(
+            self._zone_id, EMPTY_ZONE_DATA
+        )
+        zone_status = zone["zone_status"]
 
         return zone_status.get("running", False)
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return additional attributes."""
         if self.coordinator.data is None:
-            return {}
+            return EMPTY_MAPPING
 
-        zones = self.coordinator.data.get("zones", {})
-        zone_status = zones.get(self._zone_id, {})
+        zone = self.coordinator.data.get("by_zone", {}).get(
+            self._zone_id, EMPTY_ZONE_DATA
+        )
+        zone_status = zone["zone_status"]
 
         return {
             "remaining_runtime": zone_status.get("remaining_runtime", 0),
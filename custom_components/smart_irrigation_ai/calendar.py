@@ -3,21 +3,28 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .entity import device_info_for
 from .scheduling.calendar_manager import IrrigationCalendar
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO timestamp, memoized since next_run rarely changes."""
+    return datetime.fromisoformat(value)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -53,17 +60,7 @@ class IrrigationScheduleCalendar(CoordinatorEntity, CalendarEntity):
         self._calendar_manager = calendar_manager
         self._attr_name = "Smart Irrigation Schedule"
         self._attr_unique_id = f"{entry.entry_id}_calendar"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name="Smart Irrigation AI Controller",
-            manufacturer="Smart Irrigation AI",
-            model="AI Irrigation Controller",
-            sw_version="1.0.0",
-        )
+        self._attr_device_info = device_info_for(entry)
 
     @property
     def event(self) -> CalendarEvent | None:
@@ -78,7 +75,7 @@ class IrrigationScheduleCalendar(CoordinatorEntity, CalendarEntity):
             return None
 
         try:
-            next_run_dt = datetime.fromisoformat(next_run)
+            next_run_dt = _parse_iso(next_run)
         except (ValueError, TypeError):
             return None
 
@@ -99,11 +96,11 @@ class IrrigationScheduleCalendar(CoordinatorEntity, CalendarEntity):
         lines = ["**Scheduled Watering**\n"]
 
         for zone in zones:
-            if zone.get("duration_minutes", 0) > 0:
+            if zone["duration_minutes"] > 0:
                 lines.append(
-                    f"- {zone.get('zone_name', 'Zone')}: "
-                    f"{zone.get('duration_minutes')} min "
-                    f"({zone.get('water_amount_inches', 0):.2f}\")"
+                    f"- {zone['zone_name']}: "
+                    f"{zone['duration_minutes']} min "
+                    f"({zone['water_amount_inches']:.2f}\")"
                 )
 
         # Add weather info
@@ -53,7 +53,7 @@ async def discover_rachio_zones(hass: HomeAssistant) -> dict[str, Any]:
 class SmartIrrigationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Smart Irrigation AI."""
 
-    VERSION = 1
+    VERSION = 2
 
     def __init__(self) -> None:
         """Initialize the config flow."""
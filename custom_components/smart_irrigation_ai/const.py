@@ -1,11 +1,16 @@
 """Constants for Smart Irrigation AI integration."""
 from __future__ import annotations
 
-from typing import Final
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Final
 
 DOMAIN: Final = "smart_irrigation_ai"
 PLATFORMS: Final = ["sensor", "switch", "binary_sensor", "number", "select", "calendar"]
 
+# Shared read-only mapping for missing sections and empty attributes
+EMPTY_MAPPING: Final[Mapping[str, Any]] = MappingProxyType({})
+
 # Configuration keys
 CONF_RACHIO_API_KEY: Final = "rachio_api_key"
 CONF_WEATHER_ENTITY: Final = "weather_entity"
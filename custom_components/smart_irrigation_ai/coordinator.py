@@ -6,13 +6,20 @@ from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import DOMAIN, SCAN_INTERVAL_MINUTES
 
 _LOGGER = logging.getLogger(__name__)
 
+# Slice returned for zones missing from the "by_zone" index; never mutate
+EMPTY_ZONE_DATA: dict[str, Any] = {
+    "zone_status": {},
+    "moisture": {},
+    "recommendation": None,
+}
+
 
 class SmartIrrigationCoordinator(DataUpdateCoordinator):
     """Coordinator for Smart Irrigation AI data updates."""
@@ -33,6 +40,8 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=update_interval,
+            # Listeners only run when the returned data differs from the last
+            always_update=False,
         )
         self.entry = entry
         self.rachio_api = rachio_api
@@ -45,6 +54,9 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
         self._moisture_data: dict[str, Any] = {}
         self._schedule_data: dict[str, Any] = {}
         self._ai_recommendations: dict[str, Any] = {}
+        # When listeners were last given changed data; kept outside the data
+        # so a new timestamp alone is not a change
+        self.last_change: str | None = None
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from all sources."""
@@ -56,7 +68,7 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
             else:
                 # Using direct Rachio API
                 self._device_data = await self.rachio_api.async_get_device_status()
-                self._zones_data = await self.rachio_api.async_get_zones_status()
+                self._zones_data = await self.rachio_api.async_get_zones_full()
 
             # Get weather data from configured weather entity
             self._weather_data = await self._async_get_weather_data()
@@ -88,13 +100,77 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
                 "rain_sensor": rain_sensor_data,
                 "recommendations": self._ai_recommendations,
                 "schedule": self._schedule_data,
-                "last_update": datetime.now().isoformat(),
+                "by_zone": self._build_zone_index(),
+                # Factors shared by all zones (weather, season) from any zone
+                "sample_factors": next(
+                    (r.factors for r in self._ai_recommendations.values() if r.factors),
+                    {},
+                ),
             }
 
         except Exception as err:
             _LOGGER.error("Error fetching Smart Irrigation data: %s", err)
             raise UpdateFailed(f"Error fetching data: {err}") from err
 
+    @callback
+    def async_update_listeners(self) -> None:
+        """Stamp the change time before entities read the new data."""
+        self.last_change = datetime.now().isoformat()
+        super().async_update_listeners()
+
+    def _build_zone_index(self) -> dict[str, dict[str, Any]]:
+        """Group each zone's status, moisture and recommendation together.
+
+        Zone entities read their slice with a single lookup instead of
+        walking three top-level dicts on every property access.
+
+        Returns:
+            Dict of zone_id -> {"zone_status", "moisture", "recommendation"}
+        """
+        zones = self._zones_data
+        moisture = self._moisture_data
+        recommendations = self._ai_recommendations
+        return {
+            zone_id: {
+                "zone_status": zones.get(zone_id, {}),
+                "moisture": moisture.get(zone_id, {}),
+                "recommendation": recommendations.get(zone_id),
+            }
+            for zone_id in zones.keys() | moisture.keys() | recommendations.keys()
+        }
+
+    @callback
+    def async_set_zone_running(self, zone_id: str, running: bool) -> None:
+        """Optimistically mark a zone as running or stopped.
+
+        Listeners see the change immediately; the controller state is
+        picked up again on the next scheduled refresh.
+
+        Args:
+            zone_id: Zone that was started or stopped
+            running: New running state
+        """
+        zone_status = {**self._zones_data.get(zone_id, {}), "running": running}
+        self._zones_data = {**self._zones_data, zone_id: zone_status}
+
+        by_zone = dict(self.data.get("by_zone", {}))
+        by_zone[zone_id] = {
+            **by_zone.get(zone_id, EMPTY_ZONE_DATA),
+            "zone_status": zone_status,
+        }
+        self.async_set_updated_data(
+            {**self.data, "zones": self._zones_data, "by_zone": by_zone}
+        )
+
+    async def async_refresh_schedule(self) -> None:
+        """Update only the scheduler part of the data.
+
+        The scheduler state is local, so this avoids refetching the
+        controller, weather and sensors after a scheduler-only change.
+        """
+        self._schedule_data = await self.scheduler.async_get_schedule()
+        self.async_set_updated_data({**self.data, "schedule": self._schedule_data})
+
     async def _async_get_weather_data(self) -> dict[str, Any]:
         """Get weather data from Home Assistant weather entity."""
         weather_entity = self.entry.data.get("weather_entity")
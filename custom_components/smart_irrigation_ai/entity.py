@@ -0,0 +1,75 @@
+"""Shared entity helpers for Smart Irrigation AI."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers.entity import DeviceInfo
+
+from .const import DOMAIN
+
+
+def device_info_for(entry: ConfigEntry) -> DeviceInfo:
+    """Return the device info shared by all entities of a config entry."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name="Smart Irrigation AI Controller",
+        manufacturer="Smart Irrigation AI",
+        model="AI Irrigation Controller",
+        sw_version="1.0.0",
+    )
+
+
+class SkipUnchangedMixin:
+    """Skip coordinator updates that leave an entity's state input as is.
+
+    Mix in ahead of CoordinatorEntity. Per-zone entities compare their
+    "by_zone" slice by default; other entities override _state_input().
+    """
+
+    # Set by per-zone entities
+    _zone_id: str | None = None
+
+    # State input and availability as of the last state write
+    _written_input: Any = None
+    _written_available: bool = True
+
+    def _state_input(self) -> Any:
+        """Return the data this entity's state is derived from.
+
+        Returns:
+            Comparable state input, or None to write on every update
+        """
+        if self._zone_id is None:
+            return None
+        data = self.coordinator.data
+        return data.get("by_zone", {}).get(self._zone_id) if data else None
+
+    def _apply_state_input(self, state_input: Any) -> None:
+        """Store a changed state input before the state is written."""
+
+    async def async_added_to_hass(self) -> None:
+        """Take the initial state input before the first state write."""
+        await super().async_added_to_hass()
+        self._written_input = self._state_input()
+        self._written_available = self.available
+        self._apply_state_input(self._written_input)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the state input or availability changed."""
+        state_input = self._state_input()
+        available = self.available
+        if (
+            state_input is not None
+            and state_input == self._written_input
+            and available == self._written_available
+        ):
+            # Update touched other zones or sections only
+            return
+
+        self._written_input = state_input
+        self._written_available = available
+        self._apply_state_input(state_input)
+        super()._handle_coordinator_update()
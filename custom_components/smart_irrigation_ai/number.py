@@ -8,12 +8,13 @@ from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTime
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN, DEFAULT_MAX_DAILY_RUNTIME
+from .coordinator import EMPTY_ZONE_DATA
+from .entity import device_info_for
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -67,31 +68,22 @@ class SmartIrrigationNumberBase(CoordinatorEntity, NumberEntity):
         self._entity_type = entity_type
         self._attr_name = f"Smart Irrigation {name}"
         self._attr_unique_id = f"{entry.entry_id}_{entity_type}"
+        self._attr_device_info = device_info_for(entry)
         self._attr_mode = NumberMode.BOX
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name="Smart Irrigation AI Controller",
-            manufacturer="Smart Irrigation AI",
-            model="AI Irrigation Controller",
-            sw_version="1.0.0",
-        )
-
 
 class MaxDailyRuntimeNumber(SmartIrrigationNumberBase):
     """Number entity for maximum daily runtime."""
 
+    _attr_native_min_value = 10
+    _attr_native_max_value = 480
+    _attr_native_step = 5
+    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
+    _attr_icon = "mdi:timer-cog"
+
     def __init__(self, coordinator, entry: ConfigEntry) -> None:
         """Initialize the number entity."""
         super().__init__(coordinator, entry, "max_runtime", "Max Daily Runtime")
-        self._attr_native_min_value = 10
-        self._attr_native_max_value = 480
-        self._attr_native_step = 5
-        self._attr_native_unit_of_measurement = UnitOfTime.MINUTES
-        self._attr_icon = "mdi:timer-cog"
         self._value = entry.data.get("max_daily_runtime", DEFAULT_MAX_DAILY_RUNTIME)
 
     @property
@@ -113,14 +105,15 @@ class MaxDailyRuntimeNumber(SmartIrrigationNumberBase):
 class RainDelayHoursNumber(SmartIrrigationNumberBase):
     """Number entity for rain delay duration."""
 
+    _attr_native_min_value = 0
+    _attr_native_max_value = 168  # 1 week
+    _attr_native_step = 1
+    _attr_native_unit_of_measurement = UnitOfTime.HOURS
+    _attr_icon = "mdi:weather-rainy"
+
     def __init__(self, coordinator, entry: ConfigEntry) -> None:
         """Initialize the number entity."""
         super().__init__(coordinator, entry, "rain_delay_hours", "Rain Delay Hours")
-        self._attr_native_min_value = 0
-        self._attr_native_max_value = 168  # 1 week
-        self._attr_native_step = 1
-        self._attr_native_unit_of_measurement = UnitOfTime.HOURS
-        self._attr_icon = "mdi:weather-rainy"
 
     @property
     def native_value(self) -> float:
@@ -135,7 +128,7 @@ class RainDelayHoursNumber(SmartIrrigationNumberBase):
             from datetime import datetime
             try:
                 delay_until = datetime.fromisoformat(rain_delay)
-                remaining = (delay_until - dt_util.now()).total_seconds() / 3600
+                remaining = (delay_until - dt_util.utcnow()).total_seconds() / 3600
                 return max(0, round(remaining))
             except (ValueError, TypeError):
                 pass
@@ -157,14 +150,15 @@ class RainDelayHoursNumber(SmartIrrigationNumberBase):
 class SeasonalAdjustmentNumber(SmartIrrigationNumberBase):
     """Number entity for manual seasonal adjustment."""
 
+    _attr_native_min_value = 0
+    _attr_native_max_value = 200
+    _attr_native_step = 5
+    _attr_native_unit_of_measurement = "%"
+    _attr_icon = "mdi:percent"
+
     def __init__(self, coordinator, entry: ConfigEntry) -> None:
         """Initialize the number entity."""
         super().__init__(coordinator, entry, "seasonal_adjustment", "Seasonal Adjustment")
-        self._attr_native_min_value = 0
-        self._attr_native_max_value = 200
-        self._attr_native_step = 5
-        self._attr_native_unit_of_measurement = "%"
-        self._attr_icon = "mdi:percent"
         self._value = 100  # 100% = no adjustment
 
     @property
@@ -199,6 +193,12 @@ class SeasonalAdjustmentNumber(SmartIrrigationNumberBase):
 class ZoneDurationAdjustmentNumber(SmartIrrigationNumberBase):
     """Number entity for zone duration adjustment."""
 
+    _attr_native_min_value = 0
+    _attr_native_max_value = 200
+    _attr_native_step = 5
+    _attr_native_unit_of_measurement = "%"
+    _attr_icon = "mdi:tune-vertical"
+
     def __init__(
         self,
         coordinator,
@@ -215,11 +215,6 @@ class ZoneDurationAdjustmentNumber(SmartIrrigationNumberBase):
         )
         self._zone_id = zone_id
         self._zone_name = zone_name
-        self._attr_native_min_value = 0
-        self._attr_native_max_value = 200
-        self._attr_native_step = 5
-        self._attr_native_unit_of_measurement = "%"
-        self._attr_icon = "mdi:tune-vertical"
         self._value = 100  # 100% = no adjustment
 
     @property
@@ -235,10 +230,10 @@ class ZoneDurationAdjustmentNumber(SmartIrrigationNumberBase):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        recommendations = self.coordinator.data.get("recommendations", {}) if self.coordinator.data else {}
-        rec = recommendations.get(self._zone_id)
+        by_zone = self.coordinator.data.get("by_zone", {}) if self.coordinator.data else {}
+        rec = by_zone.get(self._zone_id, EMPTY_ZONE_DATA)["recommendation"]
 
-        base_duration = rec.duration_minutes if rec and hasattr(rec, 'duration_minutes') else 0
+        base_duration = rec.duration_minutes if rec is not None else 0
         adjusted_duration = int(base_duration * self._value / 100)
 
         return {
@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
+import time
+from collections import deque
 from typing import Any
 from datetime import datetime
 
@@ -11,11 +14,51 @@ from async_timeout import timeout as async_timeout
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    _json_loads = json.loads
+
 _LOGGER = logging.getLogger(__name__)
 
 RACHIO_API_BASE = "https://api.rach.io/1/public"
 RACHIO_API_TIMEOUT = 30
 
+# Client-side pacing to stay under Rachio's daily request quota
+RACHIO_MAX_CONCURRENT_REQUESTS = 4
+RACHIO_RATE_LIMIT_CALLS = 30
+RACHIO_RATE_LIMIT_PERIOD = 60  # seconds
+
+# Rachio zone payload key -> zone dict key, default
+_ZONE_FIELDS: tuple[tuple[str, str, Any], ...] = (
+    ("id", "id", None),
+    ("zoneNumber", "zone_number", None),
+    ("name", "name", None),
+    ("enabled", "enabled", True),
+    ("imageUrl", "image_url", None),
+    ("availableWater", "available_water", 0),
+    ("rootZoneDepth", "root_zone_depth", 6),
+    ("efficiency", "efficiency", 0.8),
+    ("saturatedDepthOfWater", "saturated_depth_of_water", 0),
+    ("depthOfWater", "depth_of_water", 0),
+    ("maxRuntime", "max_runtime", 10800),
+    ("runtime", "runtime", 0),
+    ("lastWateredDate", "last_watered_date", None),
+    ("lastWateredDuration", "last_watered_duration", None),
+)
+
+# Rachio zone payload key -> zone dict key, for objects that default to a
+# new empty dict per zone
+_ZONE_DICT_FIELDS: tuple[tuple[str, str], ...] = (
+    ("customNozzle", "custom_nozzle"),
+    ("customSoil", "custom_soil"),
+    ("customSlope", "custom_slope"),
+    ("customShade", "custom_shade"),
+    ("customCrop", "custom_crop"),
+)
+
 
 class RachioAPIError(Exception):
     """Exception for Rachio API errors."""
@@ -25,44 +68,114 @@ class RachioAPIError(Exception):
 class RachioAPI:
     """Rachio API client."""
 
-    def __init__(self, api_key: str, hass: HomeAssistant) -> None:
-        """Initialize the Rachio API client."""
+    def __init__(
+        self,
+        api_key: str,
+        hass: HomeAssistant,
+        device_id: str | None = None,
+        person_id: str | None = None,
+    ) -> None:
+        """Initialize the Rachio API client.
+
+        Args:
+            api_key: Rachio API key
+            hass: Home Assistant instance
+            device_id: Previously discovered device ID, if known
+            person_id: Previously discovered person ID, if known
+        """
         self._api_key = api_key
         self._hass = hass
         self._session: aiohttp.ClientSession | None = None
-        self._person_id: str | None = None
-        self._device_id: str | None = None
+        self._person_id: str | None = person_id
+        self._device_id: str | None = device_id
         self._device_info: dict[str, Any] = {}
         self._zones: list[dict[str, Any]] = []
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        }
+
+        # Device endpoint URLs, built once the device ID is known
+        self._url_device: str | None = None
+        self._url_current_schedule: str | None = None
+        self._url_forecast: str | None = None
+
+        # Request pacing
+        self._request_semaphore = asyncio.Semaphore(RACHIO_MAX_CONCURRENT_REQUESTS)
+        self._recent_calls: deque[float] = deque()
+
+        if self._device_id:
+            self._set_device_urls()
 
     @property
     def headers(self) -> dict[str, str]:
         """Return API headers."""
-        return {
-            "Authorization": f"Bearer {self._api_key}",
-            "Content-Type": "application/json",
-        }
+        return self._headers
+
+    def _set_device_urls(self) -> None:
+        """Precompute the URLs of the per-device endpoints."""
+        self._url_device = f"{RACHIO_API_BASE}/device/{self._device_id}"
+        self._url_current_schedule = f"{self._url_device}/current_schedule"
+        self._url_forecast = f"{self._url_device}/forecast?units=US"
 
     async def _async_request(
         self, method: str, endpoint: str, data: dict | None = None
     ) -> dict[str, Any]:
         """Make an API request."""
+        return await self._async_request_url(
+            method, f"{RACHIO_API_BASE}/{endpoint}", data
+        )
+
+    async def _async_request_url(
+        self, method: str, url: str, data: dict | None = None
+    ) -> dict[str, Any]:
+        """Make an API request to a fully-qualified URL.
+
+        Requests are limited to a few in flight at once and paced so that
+        bursts of calls do not trip Rachio's rate limiting.
+        """
+        async with self._request_semaphore:
+            await self._async_wait_for_rate_limit()
+            return await self._async_send_request(method, url, data)
+
+    async def _async_wait_for_rate_limit(self) -> None:
+        """Sleep until another request fits in the rate limit window."""
+        recent = self._recent_calls
+
+        while True:
+            now = time.monotonic()
+            while recent and now - recent[0] >= RACHIO_RATE_LIMIT_PERIOD:
+                recent.popleft()
+
+            if len(recent) < RACHIO_RATE_LIMIT_CALLS:
+                break
+
+            # Other concurrent callers may claim the freed slot first, so
+            # re-check the window after waking instead of assuming it
+            delay = RACHIO_RATE_LIMIT_PERIOD - (now - recent[0])
+            _LOGGER.debug("Rachio rate limit reached, delaying request %.1fs", delay)
+            await asyncio.sleep(delay)
+
+        recent.append(now)
+
+    async def _async_send_request(
+        self, method: str, url: str, data: dict | None = None
+    ) -> dict[str, Any]:
+        """Send a single API request."""
         if self._session is None:
             self._session = async_get_clientsession(self._hass)
 
-        url = f"{RACHIO_API_BASE}/{endpoint}"
-
         try:
             async with async_timeout(RACHIO_API_TIMEOUT):
                 if method == "GET":
-                    response = await self._session.get(url, headers=self.headers)
+                    response = await self._session.get(url, headers=self._headers)
                 elif method == "POST":
                     response = await self._session.post(
-                        url, headers=self.headers, json=data
+                        url, headers=self._headers, json=data
                     )
                 elif method == "PUT":
                     response = await self._session.put(
-                        url, headers=self.headers, json=data
+                        url, headers=self._headers, json=data
                     )
                 else:
                     raise RachioAPIError(f"Unsupported method: {method}")
@@ -76,10 +189,10 @@ class RachioAPI:
                         f"API request failed: {response.status} - {error_text}"
                     )
 
-                return await response.json()
+                return await response.json(loads=_json_loads)
 
         except asyncio.TimeoutError as err:
-            raise RachioAPIError(f"API request timed out: {endpoint}") from err
+            raise RachioAPIError(f"API request timed out: {url}") from err
         except aiohttp.ClientError as err:
             raise RachioAPIError(f"API request failed: {err}") from err
 
@@ -107,6 +220,7 @@ class RachioAPI:
             # Use the first device (most users have one)
             self._device_info = devices[0]
             self._device_id = self._device_info.get("id")
+            self._set_device_urls()
             self._zones = self._device_info.get("zones", [])
 
             _LOGGER.info(
@@ -120,10 +234,27 @@ class RachioAPI:
             _LOGGER.error("Failed to verify Rachio connection: %s", err)
             return False
 
+    async def async_verify_connection_if_needed(self) -> bool:
+        """Verify the connection unless the person and device IDs are known."""
+        if self._device_id and self._person_id:
+            return True
+        return await self.async_verify_connection()
+
+    async def _async_load_device(self) -> None:
+        """Load device details when discovery was skipped via stored IDs."""
+        if self._device_info or not self._device_id:
+            return
+
+        try:
+            self._device_info = await self._async_request_url("GET", self._url_device)
+            self._zones = self._device_info.get("zones", [])
+        except RachioAPIError as err:
+            _LOGGER.error("Failed to load Rachio device: %s", err)
+
     async def async_get_device_info(self) -> dict[str, Any]:
         """Get device information."""
-        if not self._device_id:
-            await self.async_verify_connection()
+        await self.async_verify_connection_if_needed()
+        await self._async_load_device()
 
         return {
             "id": self._device_id,
@@ -141,11 +272,10 @@ class RachioAPI:
 
     async def async_get_device_status(self) -> dict[str, Any]:
         """Get current device status."""
-        if not self._device_id:
-            await self.async_verify_connection()
+        await self.async_verify_connection_if_needed()
 
         try:
-            device = await self._async_request("GET", f"device/{self._device_id}")
+            device = await self._async_request_url("GET", self._url_device)
             return {
                 "status": device.get("status"),
                 "on": device.get("on"),
@@ -161,42 +291,62 @@ class RachioAPI:
 
     async def async_get_zones(self) -> list[dict[str, Any]]:
         """Get all zones."""
-        if not self._device_id:
-            await self.async_verify_connection()
+        await self.async_verify_connection_if_needed()
+        await self._async_load_device()
+
+        return [self._zone_to_dict(zone) for zone in self._zones]
+
+    @staticmethod
+    def _zone_to_dict(zone: dict[str, Any]) -> dict[str, Any]:
+        """Convert a raw Rachio zone payload to a zone dict."""
+        get = zone.get
+        zone_dict = {clean: get(raw, default) for raw, clean, default in _ZONE_FIELDS}
+        for raw, clean in _ZONE_DICT_FIELDS:
+            zone_dict[clean] = get(raw, None) or {}
+        return zone_dict
+
+    async def async_get_zones_full(self) -> dict[str, dict[str, Any]]:
+        """Get static zone data merged with live status in one pass.
+
+        Issues a single device GET and a single current_schedule GET,
+        concurrently, and refreshes the cached zone list from the result.
 
-        zones = []
+        Returns:
+            Dict of zone_id -> zone data including running state
+        """
+        await self.async_verify_connection_if_needed()
+
+        try:
+            device, current_schedule = await asyncio.gather(
+                self._async_request_url("GET", self._url_device),
+                self._async_get_current_schedule(),
+            )
+        except RachioAPIError as err:
+            _LOGGER.error("Failed to get zones: %s", err)
+            return {}
+
+        self._device_info = device
+        self._zones = device.get("zones", [])
+
+        running_zone = current_schedule.get("running_zone")
+        remaining_runtime = current_schedule.get("remaining_runtime", 0)
+
+        zones_full = {}
         for zone in self._zones:
-            zones.append({
-                "id": zone.get("id"),
-                "zone_number": zone.get("zoneNumber"),
-                "name": zone.get("name"),
-                "enabled": zone.get("enabled", True),
-                "image_url": zone.get("imageUrl"),
-                "custom_nozzle": zone.get("customNozzle", {}),
-                "custom_soil": zone.get("customSoil", {}),
-                "custom_slope": zone.get("customSlope", {}),
-                "custom_shade": zone.get("customShade", {}),
-                "custom_crop": zone.get("customCrop", {}),
-                "available_water": zone.get("availableWater", 0),
-                "root_zone_depth": zone.get("rootZoneDepth", 6),
-                "efficiency": zone.get("efficiency", 0.8),
-                "saturated_depth_of_water": zone.get("saturatedDepthOfWater", 0),
-                "depth_of_water": zone.get("depthOfWater", 0),
-                "max_runtime": zone.get("maxRuntime", 10800),
-                "runtime": zone.get("runtime", 0),
-                "last_watered_date": zone.get("lastWateredDate"),
-                "last_watered_duration": zone.get("lastWateredDuration"),
-            })
-
-        return zones
+            zone_data = self._zone_to_dict(zone)
+            running = zone_data["id"] == running_zone
+            zone_data["running"] = running
+            zone_data["remaining_runtime"] = remaining_runtime if running else 0
+            zones_full[zone_data["id"]] = zone_data
+
+        return zones_full
 
     async def async_get_zones_status(self) -> dict[str, Any]:
         """Get current status of all zones."""
-        if not self._device_id:
-            await self.async_verify_connection()
+        await self.async_verify_connection_if_needed()
 
         try:
-            device = await self._async_request("GET", f"device/{self._device_id}")
+            device = await self._async_request_url("GET", self._url_device)
             current_schedule = await self._async_get_current_schedule()
 
             zones_status = {}
@@ -220,11 +370,17 @@ class RachioAPI:
             _LOGGER.error("Failed to get zones status: %s", err)
             return {}
 
+    async def async_get_current_schedule(self) -> dict[str, Any]:
+        """Get the currently running schedule, if any."""
+        await self.async_verify_connection_if_needed()
+
+        return await self._async_get_current_schedule()
+
     async def _async_get_current_schedule(self) -> dict[str, Any]:
         """Get current running schedule."""
         try:
-            current = await self._async_request(
-                "GET", f"device/{self._device_id}/current_schedule"
+            current = await self._async_request_url(
+                "GET", self._url_current_schedule
             )
             if current:
                 return {
@@ -239,11 +395,10 @@ class RachioAPI:
 
     async def async_get_rain_sensor_status(self) -> dict[str, Any]:
         """Get rain sensor status from device."""
-        if not self._device_id:
-            await self.async_verify_connection()
+        await self.async_verify_connection_if_needed()
 
         try:
-            device = await self._async_request("GET", f"device/{self._device_id}")
+            device = await self._async_request_url("GET", self._url_device)
             return {
                 "tripped": device.get("rainSensorTripped", False),
                 "rain_delay_active": device.get("rainDelayExpirationDate") is not None,
@@ -301,8 +456,7 @@ class RachioAPI:
 
     async def async_stop_all(self) -> bool:
         """Stop all zones on the device."""
-        if not self._device_id:
-            await self.async_verify_connection()
+        await self.async_verify_connection_if_needed()
 
         try:
             await self._async_request(
@@ -316,8 +470,7 @@ class RachioAPI:
 
     async def async_set_rain_delay(self, duration_seconds: int) -> bool:
         """Set a rain delay on the device."""
-        if not self._device_id:
-            await self.async_verify_connection()
+        await self.async_verify_connection_if_needed()
 
         try:
             await self._async_request(
@@ -337,8 +490,7 @@ class RachioAPI:
 
     async def async_standby_on(self) -> bool:
         """Put device in standby mode."""
-        if not self._device_id:
-            await self.async_verify_connection()
+        await self.async_verify_connection_if_needed()
 
         try:
             await self._async_request(
@@ -352,8 +504,7 @@ class RachioAPI:
 
     async def async_standby_off(self) -> bool:
         """Take device out of standby mode."""
-        if not self._device_id:
-            await self.async_verify_connection()
+        await self.async_verify_connection_if_needed()
 
         try:
             await self._async_request(
@@ -367,12 +518,11 @@ class RachioAPI:
 
     async def async_get_forecast(self) -> list[dict[str, Any]]:
         """Get weather forecast from Rachio."""
-        if not self._device_id:
-            await self.async_verify_connection()
+        await self.async_verify_connection_if_needed()
 
         try:
-            forecast = await self._async_request(
-                "GET", f"device/{self._device_id}/forecast?units=US"
+            forecast = await self._async_request_url(
+                "GET", self._url_forecast
             )
             return forecast.get("forecast", [])
         except RachioAPIError as err:
@@ -383,13 +533,11 @@ class RachioAPI:
         self, start_time: int | None = None, end_time: int | None = None
     ) -> list[dict[str, Any]]:
         """Get device events/history."""
-        if not self._device_id:
-            await self.async_verify_connection()
+        await self.async_verify_connection_if_needed()
 
         try:
             # If no times specified, get last 7 days
             if start_time is None:
-                import time
                 end_time = int(time.time() * 1000)
                 start_time = end_time - (7 * 24 * 60 * 60 * 1000)
 
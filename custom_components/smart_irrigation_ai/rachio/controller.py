@@ -22,27 +22,26 @@ class RachioController:
 
     async def async_refresh_zones_cache(self) -> None:
         """Refresh the zones cache."""
-        zones = await self._api.async_get_zones()
-        self._zones_cache = {z["id"]: z for z in zones}
+        self._zones_cache = await self._api.async_get_zones_full()
         self._last_cache_update = datetime.now()
 
-    async def async_get_zone(self, zone_id: str) -> dict[str, Any] | None:
-        """Get a specific zone by ID."""
+    async def _async_ensure_zones_cache(self) -> None:
+        """Refresh the zones cache if it is missing or stale."""
         if (
             self._last_cache_update is None
             or datetime.now() - self._last_cache_update > self._cache_ttl
         ):
             await self.async_refresh_zones_cache()
 
+    async def async_get_zone(self, zone_id: str) -> dict[str, Any] | None:
+        """Get a specific zone by ID."""
+        await self._async_ensure_zones_cache()
+
         return self._zones_cache.get(zone_id)
 
     async def async_get_zone_by_number(self, zone_number: int) -> dict[str, Any] | None:
         """Get a specific zone by zone number."""
-        if (
-            self._last_cache_update is None
-            or datetime.now() - self._last_cache_update > self._cache_ttl
-        ):
-            await self.async_refresh_zones_cache()
+        await self._async_ensure_zones_cache()
 
         for zone in self._zones_cache.values():
             if zone.get("zone_number") == zone_number:
@@ -140,18 +139,22 @@ class RachioController:
 
     async def async_get_running_status(self) -> dict[str, Any]:
         """Get the current running status."""
-        zones_status = await self._api.async_get_zones_status()
+        current = await self._api.async_get_current_schedule()
+
+        zone_id = current.get("running_zone")
+        if zone_id is None:
+            return {"running": False}
 
-        for zone_id, status in zones_status.items():
-            if status.get("running"):
-                return {
-                    "running": True,
-                    "zone_id": zone_id,
-                    "zone_name": status.get("name"),
-                    "remaining_runtime": status.get("remaining_runtime", 0),
-                }
+        zone = self._zones_cache.get(zone_id)
+        if zone is None:
+            zone = await self.async_get_zone(zone_id) or {}
 
-        return {"running": False}
+        return {
+            "running": True,
+            "zone_id": zone_id,
+            "zone_name": zone.get("name"),
+            "remaining_runtime": current.get("remaining_runtime", 0),
+        }
 
     async def async_get_watering_history(
         self, days: int = 7
@@ -183,13 +186,14 @@ class RachioController:
             return 0.0
 
         history = await self.async_get_watering_history(days)
-        zone_history = [h for h in history if h.get("zone_id") == zone_id]
+        total_seconds = sum(
+            h.get("duration", 0) for h in history if h.get("zone_id") == zone_id
+        )
 
         # Calculate based on nozzle precipitation rate and duration
         nozzle = zone.get("custom_nozzle", {})
         precip_rate = nozzle.get("inchesPerHour", 1.5)  # Default spray head rate
 
-        total_minutes = sum(h.get("duration", 0) / 60 for h in zone_history)
-        total_inches = (total_minutes / 60) * precip_rate
+        total_inches = (total_seconds / 3600) * precip_rate
 
         return round(total_inches, 2)
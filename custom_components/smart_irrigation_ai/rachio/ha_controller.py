@@ -5,13 +5,24 @@ avoiding duplicate API calls and leveraging existing entity states.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
+import re
+from operator import itemgetter
 from datetime import datetime, timedelta
 from typing import Any
 
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import entity_registry as er
-from homeassistant.const import STATE_ON, STATE_OFF, STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.const import (
+    EVENT_SERVICE_REGISTERED,
+    EVENT_SERVICE_REMOVED,
+    STATE_ON,
+    STATE_OFF,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
+from homeassistant.util import dt as dt_util
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,6 +36,12 @@ SERVICE_PAUSE_WATERING = "pause_watering"
 SERVICE_RESUME_WATERING = "resume_watering"
 SERVICE_SET_RAIN_DELAY = "set_rain_delay"
 
+# Zone number embedded in an entity_id, e.g. switch.rachio_front_lawn_zone_1
+_ZONE_NUM_RE = re.compile(r"zone[_\s]*(\d+)")
+
+# How long a discovery result is reused before rescanning the entity registry
+DISCOVERY_CACHE_TTL = timedelta(minutes=30)
+
 
 class HAZoneController:
     """Controller that uses Home Assistant's Rachio integration for zone control."""
@@ -38,13 +55,76 @@ class HAZoneController:
         self.hass = hass
         self._zones_cache: dict[str, dict[str, Any]] = {}
         self._device_id: str | None = None
-
-    async def async_discover_rachio_entities(self) -> dict[str, Any]:
+        self._zone_entity_ids: list[str] = []
+        self._rain_sensor_entity_id: str | None = None
+        self._discovery_cache: dict[str, Any] | None = None
+        self._discovery_ts: datetime | None = None
+        self._service_availability: dict[str, bool] = {}
+        self._unsub_listeners: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_setup_listeners(self) -> None:
+        """Invalidate cached lookups when the entity or service registry changes."""
+        if self._unsub_listeners:
+            return
+
+        bus = self.hass.bus
+        self._unsub_listeners = [
+            bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_invalidate_discovery
+            ),
+            bus.async_listen(
+                EVENT_SERVICE_REGISTERED, self._async_invalidate_services
+            ),
+            bus.async_listen(EVENT_SERVICE_REMOVED, self._async_invalidate_services),
+        ]
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop listening for registry updates."""
+        for unsub in self._unsub_listeners:
+            unsub()
+        self._unsub_listeners = []
+
+    @callback
+    def _async_invalidate_services(self, event: Event) -> None:
+        """Forget cached Rachio service availability."""
+        if event.data.get("domain") == RACHIO_DOMAIN:
+            self._service_availability.clear()
+
+    @callback
+    def _async_invalidate_discovery(self, event: Event | None = None) -> None:
+        """Drop the cached discovery result."""
+        self._discovery_cache = None
+        self._discovery_ts = None
+        self._zone_entity_ids = []
+        self._rain_sensor_entity_id = None
+
+    async def async_discover_rachio_entities(
+        self, force_refresh: bool = False
+    ) -> dict[str, Any]:
         """Discover Rachio entities from Home Assistant.
 
+        The result is cached until the entity registry changes or
+        DISCOVERY_CACHE_TTL expires, so it only holds registry data and
+        names; live state is read from hass.states when needed. Empty
+        results are not cached so that setup can keep retrying while the
+        Rachio integration loads.
+
+        Args:
+            force_refresh: Rescan the entity registry even if cached
+
         Returns:
             Dictionary with device info, zones, and sensors
         """
+        if (
+            not force_refresh
+            and self._discovery_cache is not None
+            and self._discovery_ts is not None
+            and dt_util.utcnow() - self._discovery_ts < DISCOVERY_CACHE_TTL
+        ):
+            return self._discovery_cache
+
         entity_reg = er.async_get(self.hass)
 
         zones = []
@@ -55,9 +135,7 @@ class HAZoneController:
         _LOGGER.debug("Starting Rachio entity discovery")
 
         # Find all Rachio entities
-        for entity in entity_reg.entities.values():
-            if entity.platform != RACHIO_DOMAIN:
-                continue
+        for entity in self._rachio_registry_entries(entity_reg):
 
             _LOGGER.debug("Found Rachio entity: %s (domain: %s)", entity.entity_id, entity.domain)
 
@@ -70,18 +148,21 @@ class HAZoneController:
             # Zone switches - Rachio zones are switches but NOT the main controller
             # The main controller switch typically has "controller" or is the device itself
             if entity.domain == "switch":
+                attrs = state.attributes
+
                 # Check if this is NOT a zone (controller, rain delay, standby, schedule, etc.)
-                entity_id_lower = entity.entity_id.lower()
-                friendly_name_lower = (state.attributes.get("friendly_name") or "").lower()
+                # entity_ids are always lowercase in Home Assistant
+                eid = entity.entity_id
+                friendly_name_lower = (attrs.get("friendly_name") or "").lower()
 
                 is_not_zone = (
-                    "controller" in entity_id_lower or
-                    "standby" in entity_id_lower or
-                    "rain" in entity_id_lower or
-                    "delay" in entity_id_lower or
-                    "schedule" in entity_id_lower or
+                    "controller" in eid or
+                    "standby" in eid or
+                    "rain" in eid or
+                    "delay" in eid or
+                    "schedule" in eid or
                     "schedule" in friendly_name_lower or
-                    state.attributes.get("device_class") == "switch"
+                    attrs.get("device_class") == "switch"
                 )
 
                 if is_not_zone:
@@ -92,9 +173,8 @@ class HAZoneController:
                     zone_num = self._extract_zone_number(entity.entity_id, state)
                     zone_info = {
                         "entity_id": entity.entity_id,
-                        "name": state.attributes.get("friendly_name", entity.entity_id),
+                        "name": attrs.get("friendly_name", entity.entity_id),
                         "zone_id": entity.unique_id or entity.entity_id,
-                        "enabled": state.state != STATE_UNAVAILABLE,
                         "zone_number": zone_num,
                     }
                     zones.append(zone_info)
@@ -106,28 +186,66 @@ class HAZoneController:
                         device_info = await self._get_device_info(entity.device_id)
 
             # Rain sensor
-            elif entity.domain == "binary_sensor" and "rain" in entity.entity_id.lower():
+            elif entity.domain == "binary_sensor" and "rain" in entity.entity_id:
                 rain_sensors.append({
                     "entity_id": entity.entity_id,
                     "name": state.attributes.get("friendly_name", "Rain Sensor"),
-                    "state": state.state == STATE_ON,
                 })
                 _LOGGER.debug("Found rain sensor: %s", entity.entity_id)
 
         # Sort zones by zone number
-        zones.sort(key=lambda z: z.get("zone_number", 0))
+        zones.sort(key=itemgetter("zone_number"))
 
         _LOGGER.info(
             "Rachio discovery complete: %d zones, %d rain sensors, %d controller switches",
             len(zones), len(rain_sensors), len(controller_switches)
         )
 
-        return {
+        discovery = {
             "device_info": device_info,
             "zones": zones,
             "rain_sensors": rain_sensors,
         }
 
+        self._zone_entity_ids = [zone["entity_id"] for zone in zones]
+        self._rain_sensor_entity_id = (
+            rain_sensors[0]["entity_id"] if rain_sensors else None
+        )
+
+        if zones:
+            self._discovery_cache = discovery
+            self._discovery_ts = dt_util.utcnow()
+
+        return discovery
+
+    def _rachio_registry_entries(
+        self, entity_reg: er.EntityRegistry
+    ) -> list[er.RegistryEntry]:
+        """Return entity registry entries that belong to the Rachio integration.
+
+        Looks entities up through the registry's per-config-entry index so
+        only Rachio entities are visited, rather than every entity in HA.
+        """
+        rachio_entries = self.hass.config_entries.async_entries(RACHIO_DOMAIN)
+        if not rachio_entries:
+            # No Rachio config entry; fall back to scanning the registry
+            return [
+                entity
+                for entity in entity_reg.entities.values()
+                if entity.platform == RACHIO_DOMAIN
+            ]
+
+        entities = []
+        for config_entry in rachio_entries:
+            entities.extend(
+                entity
+                for entity in er.async_entries_for_config_entry(
+                    entity_reg, config_entry.entry_id
+                )
+                if entity.platform == RACHIO_DOMAIN
+            )
+        return entities
+
     async def _get_device_info(self, device_id: str) -> dict[str, Any]:
         """Get device information from device registry."""
         from homeassistant.helpers import device_registry as dr
@@ -152,24 +270,35 @@ class HAZoneController:
         if zone_num is not None:
             return int(zone_num)
 
-        # Try to extract from entity_id (e.g., switch.rachio_front_lawn_zone_1)
-        import re
-        match = re.search(r'zone[_\s]*(\d+)', entity_id.lower())
+        # Try to extract from entity_id (already lowercase in Home Assistant)
+        match = _ZONE_NUM_RE.search(entity_id)
         if match:
             return int(match.group(1))
 
         # Fallback - use order
         return 0
 
-    async def async_get_zones(self) -> list[dict[str, Any]]:
+    async def async_get_zones(
+        self, discovery: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
         """Get all Rachio zones from Home Assistant.
 
+        Args:
+            discovery: Previously fetched discovery result to reuse
+
         Returns:
             List of zone dictionaries
         """
-        discovery = await self.async_discover_rachio_entities()
+        if discovery is None:
+            discovery = await self.async_discover_rachio_entities()
         return discovery.get("zones", [])
 
+    async def _async_get_zone_entity_ids(self) -> list[str]:
+        """Return zone entity IDs, discovering them only if not yet known."""
+        if not self._zone_entity_ids:
+            await self.async_discover_rachio_entities()
+        return self._zone_entity_ids
+
     async def async_get_zone_status(self, zone_entity_id: str) -> dict[str, Any]:
         """Get current status of a zone.
 
@@ -179,33 +308,41 @@ class HAZoneController:
         Returns:
             Zone status dictionary
         """
+        return self._get_zone_status(zone_entity_id)
+
+    def _get_zone_status(self, zone_entity_id: str) -> dict[str, Any]:
+        """Build a zone status dict from the current state machine."""
         state = self.hass.states.get(zone_entity_id)
         if not state:
             return {"available": False}
 
+        attrs = state.attributes
         return {
             "entity_id": zone_entity_id,
-            "name": state.attributes.get("friendly_name"),
+            "name": attrs.get("friendly_name"),
             "running": state.state == STATE_ON,
             "available": state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN),
             "last_changed": state.last_changed.isoformat() if state.last_changed else None,
-            "attributes": dict(state.attributes),
+            "attributes": attrs,
         }
 
-    async def async_get_all_zones_status(self) -> dict[str, dict[str, Any]]:
+    async def async_get_all_zones_status(
+        self, discovery: dict[str, Any] | None = None
+    ) -> dict[str, dict[str, Any]]:
         """Get status of all zones.
 
+        Args:
+            discovery: Previously fetched discovery result to reuse
+
         Returns:
             Dictionary of zone_entity_id -> status
         """
-        zones = await self.async_get_zones()
-        statuses = {}
-
-        for zone in zones:
-            entity_id = zone["entity_id"]
-            statuses[entity_id] = await self.async_get_zone_status(entity_id)
+        zones = await self.async_get_zones(discovery)
 
-        return statuses
+        return {
+            zone["entity_id"]: self._get_zone_status(zone["entity_id"])
+            for zone in zones
+        }
 
     async def async_run_zone(
         self,
@@ -307,27 +444,41 @@ class HAZoneController:
             True if successful
         """
         try:
+            zone_entity_ids = await self._async_get_zone_entity_ids()
+
             # Use Rachio stop service if available
             if self._has_rachio_service(SERVICE_STOP_WATERING):
-                # Get all zone entity IDs
-                zones = await self.async_get_zones()
-                for zone in zones:
-                    await self.hass.services.async_call(
-                        RACHIO_DOMAIN,
-                        SERVICE_STOP_WATERING,
-                        {"entity_id": zone["entity_id"]},
-                        blocking=True,
-                    )
-            else:
-                # Fallback - turn off all zone switches
-                zones = await self.async_get_zones()
-                for zone in zones:
-                    await self.hass.services.async_call(
-                        "switch",
-                        "turn_off",
-                        {"entity_id": zone["entity_id"]},
-                        blocking=True,
-                    )
+                # stop_watering targets one entity per call
+                results = await asyncio.gather(
+                    *(
+                        self.hass.services.async_call(
+                            RACHIO_DOMAIN,
+                            SERVICE_STOP_WATERING,
+                            {"entity_id": entity_id},
+                            blocking=True,
+                        )
+                        for entity_id in zone_entity_ids
+                    ),
+                    return_exceptions=True,
+                )
+
+                failed = False
+                for entity_id, result in zip(zone_entity_ids, results):
+                    if isinstance(result, Exception):
+                        _LOGGER.error("Failed to stop zone %s: %s", entity_id, result)
+                        failed = True
+
+                if failed:
+                    return False
+
+            elif zone_entity_ids:
+                # Fallback - turn off all zone switches in one call
+                await self.hass.services.async_call(
+                    "switch",
+                    "turn_off",
+                    {"entity_id": zone_entity_ids},
+                    blocking=True,
+                )
 
             _LOGGER.info("Stopped all zones")
             return True
@@ -336,22 +487,30 @@ class HAZoneController:
             _LOGGER.error("Failed to stop all zones: %s", err)
             return False
 
-    async def async_get_rain_sensor_status(self) -> dict[str, Any]:
+    async def async_get_rain_sensor_status(
+        self, discovery: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
         """Get rain sensor status from Home Assistant entity.
 
+        Args:
+            discovery: Previously fetched discovery result to reuse
+
         Returns:
             Rain sensor status dictionary
         """
-        discovery = await self.async_discover_rachio_entities()
-        rain_sensors = discovery.get("rain_sensors", [])
+        if discovery is not None:
+            rain_sensors = discovery.get("rain_sensors", [])
+            sensor_entity_id = rain_sensors[0]["entity_id"] if rain_sensors else None
+        else:
+            await self._async_get_zone_entity_ids()
+            sensor_entity_id = self._rain_sensor_entity_id
 
-        if rain_sensors:
-            sensor = rain_sensors[0]
-            state = self.hass.states.get(sensor["entity_id"])
+        if sensor_entity_id:
+            state = self.hass.states.get(sensor_entity_id)
 
             if state:
                 return {
-                    "entity_id": sensor["entity_id"],
+                    "entity_id": sensor_entity_id,
                     "tripped": state.state == STATE_ON,
                     "available": state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN),
                     "last_changed": state.last_changed.isoformat() if state.last_changed else None,
@@ -371,13 +530,13 @@ class HAZoneController:
         try:
             if self._has_rachio_service(SERVICE_SET_RAIN_DELAY):
                 # Get device entity to call service on
-                zones = await self.async_get_zones()
-                if zones:
+                zone_entity_ids = await self._async_get_zone_entity_ids()
+                if zone_entity_ids:
                     await self.hass.services.async_call(
                         RACHIO_DOMAIN,
                         SERVICE_SET_RAIN_DELAY,
                         {
-                            "entity_id": zones[0]["entity_id"],
+                            "entity_id": zone_entity_ids[0],
                             "duration": hours * 3600,  # Convert to seconds
                         },
                         blocking=True,
@@ -401,15 +560,24 @@ class HAZoneController:
         Returns:
             True if service is available
         """
-        return self.hass.services.has_service(RACHIO_DOMAIN, service_name)
-
-    async def async_get_running_zone(self) -> dict[str, Any] | None:
+        available = self._service_availability.get(service_name)
+        if available is None:
+            available = self.hass.services.has_service(RACHIO_DOMAIN, service_name)
+            self._service_availability[service_name] = available
+        return available
+
+    async def async_get_running_zone(
+        self, discovery: dict[str, Any] | None = None
+    ) -> dict[str, Any] | None:
         """Get the currently running zone, if any.
 
+        Args:
+            discovery: Previously fetched discovery result to reuse
+
         Returns:
             Zone info dict if a zone is running, None otherwise
         """
-        zones = await self.async_get_zones()
+        zones = await self.async_get_zones(discovery)
 
         for zone in zones:
             state = self.hass.states.get(zone["entity_id"])
@@ -429,12 +597,21 @@ class HAZoneController:
         Returns:
             Device state dictionary
         """
-        zones_status = await self.async_get_all_zones_status()
-        rain_sensor = await self.async_get_rain_sensor_status()
-        running_zone = await self.async_get_running_zone()
-
-        any_running = any(z.get("running") for z in zones_status.values())
-        all_available = all(z.get("available") for z in zones_status.values())
+        discovery = await self.async_discover_rachio_entities()
+        zones_status = await self.async_get_all_zones_status(discovery)
+        rain_sensor = await self.async_get_rain_sensor_status(discovery)
+        running_zone = await self.async_get_running_zone(discovery)
+
+        any_running = False
+        all_available = True
+        enabled_zones = 0
+        for zone_status in zones_status.values():
+            if zone_status.get("running"):
+                any_running = True
+            if zone_status.get("available"):
+                enabled_zones += 1
+            else:
+                all_available = False
 
         return {
             "available": all_available,
@@ -442,5 +619,5 @@ class HAZoneController:
             "running_zone": running_zone,
             "rain_sensor_tripped": rain_sensor.get("tripped", False),
             "total_zones": len(zones_status),
-            "enabled_zones": sum(1 for z in zones_status.values() if z.get("available")),
+            "enabled_zones": enabled_zones,
         }
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
 from datetime import datetime, timedelta, date
 from typing import Any
 
@@ -9,8 +10,24 @@ from homeassistant.core import HomeAssistant
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.util import dt as dt_util
 
+from ..const import DEFAULT_WATERING_DAYS
+
 _LOGGER = logging.getLogger(__name__)
 
+# Number of distinct date ranges whose events are kept
+EVENTS_CACHE_SIZE = 16
+
+# English day names indexed by date.weekday(), as shown in the forecast
+_DAY_NAMES = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+
 
 class IrrigationCalendar:
     """Manage irrigation calendar events."""
@@ -25,123 +42,133 @@ class IrrigationCalendar:
         self.hass = hass
         self.scheduler = scheduler
         self._events: list[CalendarEvent] = []
+        self._events_cache: OrderedDict[
+            tuple[datetime, datetime, int], list[CalendarEvent]
+        ] = OrderedDict()
 
     async def async_get_events(
         self,
         start_date: datetime,
         end_date: datetime,
+        *,
+        cache: bool = True,
     ) -> list[CalendarEvent]:
         """Get calendar events for a date range.
 
         Args:
             start_date: Start of range
             end_date: End of range
+            cache: Keep the events for repeat requests of the same range;
+                ranges built from the current time never repeat
 
         Returns:
             List of calendar events
         """
+        scheduler = self.scheduler
+        if not scheduler.has_events:
+            # Nothing scheduled or recorded can fall in this range
+            return []
+
+        if cache:
+            key = (start_date, end_date, scheduler.generation)
+            cached = self._events_cache.get(key)
+            if cached is None:
+                cached = self._build_events(start_date, end_date)
+                self._events_cache[key] = cached
+                if len(self._events_cache) > EVENTS_CACHE_SIZE:
+                    self._events_cache.popitem(last=False)
+            else:
+                self._events_cache.move_to_end(key)
+            events = list(cached)
+        else:
+            events = self._build_events(start_date, end_date)
+
+        # Rain delay starts "now", so it is added fresh on every call
+        delay_until = scheduler.rain_delay_until
+        if delay_until and start_date <= delay_until <= end_date:
+            events.append(CalendarEvent(
+                start=dt_util.now(),
+                end=delay_until,
+                summary="Rain Delay Active",
+                description="Irrigation paused due to rain delay",
+            ))
+
+        return events
+
+    def _build_events(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[CalendarEvent]:
+        """Build schedule and history events for a date range."""
         events = []
 
-        # Get current schedule
-        schedule = await self.scheduler.async_get_schedule()
-        zones = schedule.get("schedule", {}).get("zones", [])
-
-        # Add next scheduled run
-        next_run = schedule.get("next_run")
-        if next_run:
-            try:
-                next_run_dt = datetime.fromisoformat(next_run)
-                if start_date <= next_run_dt <= end_date:
-                    # Calculate end time based on total duration
-                    total_duration = sum(z.get("duration_minutes", 0) for z in zones)
-                    end_time = next_run_dt + timedelta(minutes=total_duration)
-
-                    # Build summary
-                    zone_count = len([z for z in zones if z.get("duration_minutes", 0) > 0])
-                    summary = f"Smart Irrigation: {zone_count} zones, {total_duration} min"
-
-                    # Build description
-                    description_parts = ["**Scheduled Watering**\n"]
-                    for zone in zones:
-                        if zone.get("duration_minutes", 0) > 0:
-                            description_parts.append(
-                                f"- {zone.get('zone_name', 'Zone')}: {zone.get('duration_minutes')} min "
-                                f"({zone.get('water_amount_inches', 0):.2f}\")"
-                            )
-
-                    events.append(CalendarEvent(
-                        start=next_run_dt,
-                        end=end_time,
-                        summary=summary,
-                        description="\n".join(description_parts),
-                    ))
-            except (ValueError, TypeError):
-                pass
+        # Add next scheduled run; only format it when it falls in range
+        next_run_dt = self.scheduler.next_run
+        if next_run_dt and start_date <= next_run_dt <= end_date:
+            # Total duration, zone count and description in one pass
+            total_duration = 0
+            zone_count = 0
+            description_parts = ["**Scheduled Watering**\n"]
+            for zone in self.scheduler._schedule.get("zones", []):
+                duration = zone["duration_minutes"]
+                if duration > 0:
+                    total_duration += duration
+                    zone_count += 1
+                    description_parts.append(
+                        f"- {zone['zone_name']}: {duration} min "
+                        f"({zone['water_amount_inches']:.2f}\")"
+                    )
+
+            end_time = next_run_dt + timedelta(minutes=total_duration)
+            summary = f"Smart Irrigation: {zone_count} zones, {total_duration} min"
+
+            events.append(CalendarEvent(
+                start=next_run_dt,
+                end=end_time,
+                summary=summary,
+                description="\n".join(description_parts),
+            ))
 
         # Add historical runs
-        history = self.scheduler.get_run_history()
-        for run in history:
-            try:
-                run_time = datetime.fromisoformat(run["timestamp"])
-                if start_date <= run_time <= end_date:
-                    duration = run.get("total_duration", 0)
-                    end_time = run_time + timedelta(minutes=duration)
-
-                    # Include AI decision info if available
-                    ai_decision = run.get("ai_decision", {})
-                    confidence = ai_decision.get("confidence", 0)
-
-                    events.append(CalendarEvent(
-                        start=run_time,
-                        end=end_time,
-                        summary=f"Irrigation Complete: {run.get('zones', 0)} zones",
-                        description=f"Watered {run.get('zones', 0)} zones for {duration} minutes\n"
-                                   f"AI Confidence: {confidence*100:.0f}%",
-                    ))
-            except (ValueError, TypeError):
-                pass
+        for run_time, run in self.scheduler.get_run_history_between(start_date, end_date):
+            duration = run.get("total_duration", 0)
+            end_time = run_time + timedelta(minutes=duration)
+
+            # Include AI decision info if available
+            ai_decision = run.get("ai_decision", {})
+            confidence = ai_decision.get("confidence", 0)
+
+            events.append(CalendarEvent(
+                start=run_time,
+                end=end_time,
+                summary=f"Irrigation Complete: {run.get('zones', 0)} zones",
+                description=f"Watered {run.get('zones', 0)} zones for {duration} minutes\n"
+                           f"AI Confidence: {confidence*100:.0f}%",
+            ))
 
         # Add AI decision history (skipped days)
-        decision_history = self.scheduler.get_decision_history()
-        for decision in decision_history:
-            try:
-                decision_time = datetime.fromisoformat(decision["timestamp"])
-                if start_date <= decision_time <= end_date:
-                    decision_type = decision.get("type", "")
-
-                    if decision_type == "ai_skipped":
-                        events.append(CalendarEvent(
-                            start=decision_time,
-                            end=decision_time + timedelta(minutes=5),
-                            summary=f"AI Skipped: {decision.get('reason', 'N/A')[:30]}",
-                            description=f"AI decided not to water\n"
-                                       f"Reason: {decision.get('reason', 'N/A')}",
-                        ))
-                    elif decision_type == "skipped":
-                        events.append(CalendarEvent(
-                            start=decision_time,
-                            end=decision_time + timedelta(minutes=5),
-                            summary=f"Skipped: {decision.get('reason', 'Manual')[:30]}",
-                            description=f"Watering skipped\n"
-                                       f"Reason: {decision.get('reason', 'N/A')}",
-                        ))
-            except (ValueError, TypeError):
-                pass
-
-        # Add rain delay if active
-        rain_delay = schedule.get("rain_delay_until")
-        if rain_delay:
-            try:
-                delay_until = datetime.fromisoformat(rain_delay)
-                if start_date <= delay_until <= end_date:
-                    events.append(CalendarEvent(
-                        start=dt_util.now(),
-                        end=delay_until,
-                        summary="Rain Delay Active",
-                        description="Irrigation paused due to rain delay",
-                    ))
-            except (ValueError, TypeError):
-                pass
+        for decision_time, decision in self.scheduler.get_decision_history_between(
+            start_date, end_date
+        ):
+            decision_type = decision.get("type", "")
+
+            if decision_type == "ai_skipped":
+                events.append(CalendarEvent(
+                    start=decision_time,
+                    end=decision_time + timedelta(minutes=5),
+                    summary=f"AI Skipped: {decision.get('reason', 'N/A')[:30]}",
+                    description=f"AI decided not to water\n"
+                               f"Reason: {decision.get('reason', 'N/A')}",
+                ))
+            elif decision_type == "skipped":
+                events.append(CalendarEvent(
+                    start=decision_time,
+                    end=decision_time + timedelta(minutes=5),
+                    summary=f"Skipped: {decision.get('reason', 'Manual')[:30]}",
+                    description=f"Watering skipped\n"
+                               f"Reason: {decision.get('reason', 'N/A')}",
+                ))
 
         return events
 
@@ -157,7 +184,7 @@ class IrrigationCalendar:
         now = dt_util.now()
         end = now + timedelta(days=days)
 
-        events = await self.async_get_events(now, end)
+        events = await self.async_get_events(now, end, cache=False)
 
         return [
             {
@@ -181,14 +208,30 @@ class IrrigationCalendar:
         forecast = []
         schedule = self.scheduler._schedule
 
-        watering_days = self.scheduler._watering_days or [0, 2, 4, 6]
+        watering_days = self.scheduler.watering_days or DEFAULT_WATERING_DAYS
+
+        # Schedule totals are the same for every day that shows zones
+        active_zones_count = 0
+        total_duration = 0
+        total_water = 0
+        for zone in schedule.get("zones", []):
+            duration = zone["duration_minutes"]
+            if duration > 0:
+                active_zones_count += 1
+                total_duration += duration
+            total_water += zone["water_amount_inches"]
+
+        today = date.today()
+        base_ordinal = today.toordinal()
+        base_weekday = today.weekday()
+        decision = self.scheduler._daily_decision
 
         for i in range(days):
-            check_date = date.today() + timedelta(days=i)
-            weekday = check_date.weekday()
+            check_date = date.fromordinal(base_ordinal + i)
+            weekday = (base_weekday + i) % 7
 
             is_watering_day = weekday in watering_days
-            zones = schedule.get("zones", []) if is_watering_day and i < 2 else []
+            has_zones = is_watering_day and i < 2
 
             # Get scheduled time for this date (handles sun events)
             scheduled_time = None
@@ -199,18 +242,17 @@ class IrrigationCalendar:
 
             # Check if AI would skip this day (based on current data, for display)
             ai_status = "pending"
-            if i == 0 and self.scheduler._daily_decision:
-                decision = self.scheduler._daily_decision
+            if i == 0 and decision:
                 ai_status = "water" if decision.get("should_water") else "skip"
 
             forecast.append({
                 "date": check_date.isoformat(),
-                "day_name": check_date.strftime("%A"),
+                "day_name": _DAY_NAMES[weekday],
                 "is_watering_day": is_watering_day,
                 "scheduled_time": scheduled_time,
-                "zones_count": len([z for z in zones if z.get("duration_minutes", 0) > 0]),
-                "total_duration": sum(z.get("duration_minutes", 0) for z in zones),
-                "total_water_inches": sum(z.get("water_amount_inches", 0) for z in zones),
+                "zones_count": active_zones_count if has_zones else 0,
+                "total_duration": total_duration if has_zones else 0,
+                "total_water_inches": total_water if has_zones else 0,
                 "ai_status": ai_status,
             })
 
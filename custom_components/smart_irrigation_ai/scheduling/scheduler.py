@@ -2,25 +2,36 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
+from bisect import bisect_left, bisect_right
+from collections import deque
+from itertools import islice
 from datetime import datetime, timedelta, time, date
 from typing import Any, Callable
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_track_time_interval, async_track_point_in_time
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.sun import get_astral_event_date
 from homeassistant.util import dt as dt_util
 
 from ..const import (
+    DOMAIN,
+    EMPTY_MAPPING,
     DEFAULT_WATERING_DAYS,
     DEFAULT_SCHEDULE_MODE,
     DEFAULT_SCHEDULE_TIME,
     DEFAULT_SUN_OFFSET,
     SCHEDULE_RECALC_HOURS,
+    CONF_ZONES,
+    CONF_WATERING_DAYS,
     CONF_SCHEDULE_MODE,
     CONF_SCHEDULE_TIME,
     CONF_SCHEDULE_SUN_EVENT,
     CONF_SUN_OFFSET,
+    CONF_CYCLE_SOAK_ENABLED,
     SCHEDULE_MODE_START_AT,
     SCHEDULE_MODE_FINISH_BY,
     SUN_EVENT_SUNRISE,
@@ -29,6 +40,63 @@ from ..const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Persisted scheduler state, written at most once per delay
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 30
+
+# Config keys a stored schedule depends on; only their digest is persisted
+_SCHEDULE_CONFIG_KEYS = (
+    CONF_ZONES,
+    CONF_WATERING_DAYS,
+    CONF_SCHEDULE_MODE,
+    CONF_SCHEDULE_TIME,
+    CONF_SCHEDULE_SUN_EVENT,
+    CONF_SUN_OFFSET,
+    CONF_CYCLE_SOAK_ENABLED,
+    "max_daily_runtime",
+    "watering_start_time",
+    "watering_end_time",
+)
+
+# Number of runs and daily decisions kept in history
+RUN_HISTORY_SIZE = 30
+DECISION_HISTORY_SIZE = 60
+
+# How long recommendations from the daily decision may be reused (seconds)
+RECOMMENDATIONS_REUSE_SECONDS = 60
+
+# A schedule calculated this recently is run as is instead of recalculated
+SCHEDULE_FRESH_WINDOW = timedelta(minutes=15)
+
+# Weeks of upcoming run times precomputed per schedule calculation
+UPCOMING_RUN_WEEKS = 2
+
+# Number of (event, date) sun times kept
+SUN_CACHE_SIZE = 16
+
+# Weather conditions that count as currently raining
+_RAINY_CONDITIONS = frozenset({"rainy", "pouring"})
+
+
+def _scheduler_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the Store holding a config entry's scheduler state."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}_scheduler_{entry_id}")
+
+
+async def async_remove_scheduler_store(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the persisted scheduler state of a removed config entry."""
+    await _scheduler_store(hass, entry_id).async_remove()
+
+
+def _schedule_config_digest(config: dict[str, Any]) -> str:
+    """Return a digest of the config keys a calculated schedule depends on.
+
+    Stored instead of the config itself, which also holds the Rachio API key.
+    """
+    relevant = {key: config.get(key) for key in _SCHEDULE_CONFIG_KEYS}
+    encoded = json.dumps(relevant, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
 
 class SmartScheduler:
     """Intelligent scheduler for irrigation operations."""
@@ -40,6 +108,7 @@ class SmartScheduler:
         rachio_api,
         ai_model,
         use_ha_rachio: bool = True,
+        entry_id: str | None = None,
     ) -> None:
         """Initialize the scheduler.
 
@@ -49,19 +118,34 @@ class SmartScheduler:
             rachio_api: Rachio API client or HA controller
             ai_model: AI irrigation model
             use_ha_rachio: Whether using HA Rachio integration
+            entry_id: Config entry ID, used to persist state across restarts
         """
         self.hass = hass
         self.config = config
+        self._config_digest = _schedule_config_digest(config)
         self.rachio_api = rachio_api
         self.ai_model = ai_model
         self.use_ha_rachio = use_ha_rachio
+        self._store: Store | None = (
+            _scheduler_store(hass, entry_id) if entry_id else None
+        )
 
         # Parse configuration
-        self._watering_days = config.get("watering_days", DEFAULT_WATERING_DAYS)
+        # Weekdays to water on (Monday=0), sorted and without duplicates
+        self._watering_days: tuple[int, ...] = tuple(sorted({
+            int(day) for day in config.get("watering_days", DEFAULT_WATERING_DAYS)
+        }))
         self._schedule_mode = config.get(CONF_SCHEDULE_MODE, DEFAULT_SCHEDULE_MODE)
         self._schedule_time = config.get(CONF_SCHEDULE_TIME)
+        # The config flow's time selector has already validated the string.
+        # Options changes reload the entry, so the parsed time stays current.
+        self._parsed_schedule_time: time | None = (
+            dt_util.parse_time(self._schedule_time) if self._schedule_time else None
+        )
         self._schedule_sun_event = config.get(CONF_SCHEDULE_SUN_EVENT)
         self._sun_offset = config.get(CONF_SUN_OFFSET, DEFAULT_SUN_OFFSET)
+        self._sun_offset_td = timedelta(minutes=int(self._sun_offset))
+        self._recalc_interval = timedelta(hours=SCHEDULE_RECALC_HOURS)
         self._cycle_soak_enabled = config.get("cycle_soak_enabled", True)
 
         # State
@@ -72,25 +156,40 @@ class SmartScheduler:
         self._current_zone: str | None = None
         self._skip_next = False
         self._rain_delay_until: datetime | None = None
+        # ISO strings of the datetimes above, refreshed wherever they change
+        self._next_run_iso: str | None = None
+        self._last_run_iso: str | None = None
+        self._rain_delay_until_iso: str | None = None
+        self._schedule_calculated_at: datetime | None = None
+        self._upcoming_runs: list[datetime] = []
         self._unsub_timer: Callable | None = None
+        # Run time the armed timer fires at, to avoid re-arming for the same time
+        self._scheduled_for: datetime | None = None
         self._unsub_recalc: Callable | None = None
+        self._sun_cache: dict[tuple[str, date], datetime | None] = {}
 
-        # History
-        self._run_history: list[dict[str, Any]] = []
+        # History, with parsed timestamps kept alongside each entry
+        self._run_history: deque[dict[str, Any]] = deque(maxlen=RUN_HISTORY_SIZE)
+        self._run_history_ts: deque[datetime] = deque(maxlen=RUN_HISTORY_SIZE)
+        # List handed out by get_run_history, rebuilt after a run is recorded
+        self._run_history_list: list[dict[str, Any]] | None = None
 
         # Daily AI decision tracking
         self._daily_decision: dict[str, Any] = {}
-        self._decision_history: list[dict[str, Any]] = []
+        self._decision_recommendations: dict[str, Any] | None = None
+        self._decision_recommendations_time = 0.0
+        self._decision_history: deque[dict[str, Any]] = deque(
+            maxlen=DECISION_HISTORY_SIZE
+        )
+        self._decision_history_ts: deque[datetime] = deque(
+            maxlen=DECISION_HISTORY_SIZE
+        )
 
-    def _parse_time(self, time_str: str | None) -> time | None:
-        """Parse time string."""
-        if not time_str:
-            return None
-        try:
-            parts = time_str.split(":")
-            return time(int(parts[0]), int(parts[1]))
-        except (ValueError, IndexError):
-            return time(5, 0)
+        # Bumped whenever the schedule, next run or history changes
+        self._generation = 0
+
+        # Calculation in progress, shared with concurrent callers
+        self._calc_task: asyncio.Task[dict[str, Any]] | None = None
 
     def _get_sun_event_time(self, event: str, target_date: date) -> datetime | None:
         """Get sunrise or sunset time for a specific date.
@@ -102,17 +201,25 @@ class SmartScheduler:
         Returns:
             datetime of the sun event, or None if unavailable
         """
+        key = (event, target_date)
+        if key in self._sun_cache:
+            return self._sun_cache[key]
+
         try:
             event_time = get_astral_event_date(
                 self.hass,
                 event,
                 target_date,
             )
-            return event_time
         except Exception as err:
             _LOGGER.error("Error getting %s time: %s", event, err)
             return None
 
+        self._sun_cache[key] = event_time
+        if len(self._sun_cache) > SUN_CACHE_SIZE:
+            self._sun_cache.pop(next(iter(self._sun_cache)))
+        return event_time
+
     def _get_scheduled_time(self, target_date: date) -> datetime | None:
         """Calculate the scheduled time for a specific date.
 
@@ -127,24 +234,29 @@ class SmartScheduler:
             sun_time = self._get_sun_event_time(self._schedule_sun_event, target_date)
             if sun_time:
                 # Apply offset
-                scheduled = sun_time + timedelta(minutes=self._sun_offset)
+                scheduled = sun_time + self._sun_offset_td
                 return scheduled
             else:
                 # Fallback to 5 AM if sun event unavailable
-                return datetime.combine(target_date, time(5, 0))
+                return datetime.combine(
+                    target_date, time(5, 0), tzinfo=dt_util.DEFAULT_TIME_ZONE
+                )
         else:
-            # Use specific time
-            parsed_time = self._parse_time(self._schedule_time)
-            if parsed_time:
-                return datetime.combine(target_date, parsed_time)
-            return datetime.combine(target_date, time(5, 0))
+            # Use specific time, built directly as an aware local datetime
+            return datetime.combine(
+                target_date,
+                self._parsed_schedule_time or time(5, 0),
+                tzinfo=dt_util.DEFAULT_TIME_ZONE,
+            )
 
     async def async_start(self) -> None:
         """Start the scheduler."""
         _LOGGER.info("Starting Smart Irrigation scheduler")
+        self._sun_cache.clear()
 
-        # Calculate initial schedule
-        await self.async_calculate_schedule()
+        # Calculate initial schedule, unless a recent one was restored
+        if not await self._async_restore():
+            await self.async_calculate_schedule()
 
         # Schedule next run
         await self._schedule_next_run()
@@ -153,7 +265,7 @@ class SmartScheduler:
         self._unsub_recalc = async_track_time_interval(
             self.hass,
             self._async_recalculate_callback,
-            timedelta(hours=SCHEDULE_RECALC_HOURS),
+            self._recalc_interval,
         )
 
     async def async_stop(self) -> None:
@@ -163,6 +275,7 @@ class SmartScheduler:
         if self._unsub_timer:
             self._unsub_timer()
             self._unsub_timer = None
+            self._scheduled_for = None
 
         if self._unsub_recalc:
             self._unsub_recalc()
@@ -173,6 +286,76 @@ class SmartScheduler:
             await self.rachio_api.async_stop_all()
             self._is_running = False
 
+    async def _async_restore(self) -> bool:
+        """Restore persisted schedule, history and rain delay.
+
+        Returns:
+            True if a schedule calculated with the current config less than
+            SCHEDULE_RECALC_HOURS ago was restored
+        """
+        if self._store is None:
+            return False
+
+        data = await self._store.async_load()
+        if not data:
+            return False
+
+        for record in data.get("run_history", []):
+            timestamp = dt_util.parse_datetime(record.get("timestamp") or "")
+            if timestamp is not None:
+                self._run_history.append(record)
+                self._run_history_ts.append(timestamp)
+        self._run_history_list = None
+
+        self._last_run_iso = data.get("last_run")
+        if self._last_run_iso:
+            self._last_run = dt_util.parse_datetime(self._last_run_iso)
+
+        delay_until = dt_util.parse_datetime(data.get("rain_delay_until") or "")
+        if delay_until is not None and delay_until > dt_util.utcnow():
+            self._rain_delay_until = delay_until
+            self._rain_delay_until_iso = data["rain_delay_until"]
+
+        self._generation += 1
+
+        # A schedule is only reusable if it is recent and came from the
+        # same configuration
+        calculated_at = dt_util.parse_datetime(data.get("schedule_calculated_at") or "")
+        if (
+            calculated_at is None
+            or dt_util.utcnow() - calculated_at >= self._recalc_interval
+            or not data.get("schedule")
+            or data.get("config_digest") != self._config_digest
+        ):
+            return False
+
+        self._schedule = data["schedule"]
+        self._schedule_calculated_at = calculated_at
+        _LOGGER.debug("Restored schedule calculated at %s", calculated_at)
+        return True
+
+    @callback
+    def _data_to_store(self) -> dict[str, Any]:
+        """Return the scheduler state to persist."""
+        return {
+            "config_digest": self._config_digest,
+            "schedule": self._schedule,
+            "schedule_calculated_at": (
+                self._schedule_calculated_at.isoformat()
+                if self._schedule_calculated_at
+                else None
+            ),
+            "last_run": self._last_run_iso,
+            "rain_delay_until": self._rain_delay_until_iso,
+            "run_history": self.get_run_history(),
+        }
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Persist state after STORAGE_SAVE_DELAY, folding bursts of changes."""
+        if self._store is not None:
+            self._store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY)
+
     @callback
     def _async_recalculate_callback(self, now: datetime) -> None:
         """Callback for periodic recalculation."""
@@ -181,26 +364,82 @@ class SmartScheduler:
     async def async_calculate_schedule(self) -> dict[str, Any]:
         """Calculate the watering schedule.
 
+        Calls made while a calculation is already running wait for that
+        calculation and share its result instead of starting another.
+
         Returns:
             Schedule dictionary
         """
+        task = self._calc_task
+        if task is None:
+            task = self._calc_task = self.hass.async_create_task(
+                self._async_calculate_schedule()
+            )
+            task.add_done_callback(self._async_calc_done)
+
+        # Shielded so a cancelled caller cannot cancel the shared calculation;
+        # a failure is raised to every caller waiting on it
+        return await asyncio.shield(task)
+
+    @callback
+    def _async_calc_done(self, task: asyncio.Task[dict[str, Any]]) -> None:
+        """Let the next call start a new calculation."""
+        if self._calc_task is task:
+            self._calc_task = None
+
+    async def _async_calculate_schedule(self) -> dict[str, Any]:
+        """Run a single schedule calculation."""
         _LOGGER.debug("Calculating irrigation schedule")
 
+        # Sun times for past dates will not be asked for again
+        today = dt_util.now().date()
+        for key in [key for key in self._sun_cache if key[1] < today]:
+            del self._sun_cache[key]
+
         try:
-            # Get optimized schedule from AI model
-            zone_schedule = await self.ai_model.async_get_optimized_schedule()
+            # Get optimized schedule from AI model. Every zone entry carries
+            # zone_id, zone_name, duration_minutes, duration_seconds,
+            # water_amount_inches and cycles (each with cycle_seconds), so
+            # consumers of the schedule index those keys directly.
+            recommendations = self._decision_recommendations
+            self._decision_recommendations = None
+            if (
+                recommendations is not None
+                and self.hass.loop.time() - self._decision_recommendations_time
+                < RECOMMENDATIONS_REUSE_SECONDS
+            ):
+                # Reuse what the daily decision just computed
+                zone_schedule = self.ai_model.build_schedule_from_recommendations(
+                    recommendations
+                )
+            else:
+                zone_schedule = await self.ai_model.async_get_optimized_schedule()
+
+            # Total runtime and zone count in one pass
+            total_runtime = 0
+            zones_to_water = 0
+            for zone in zone_schedule:
+                duration = zone["duration_minutes"]
+                total_runtime += duration
+                if duration > 0:
+                    zones_to_water += 1
 
             # Build schedule
+            self._schedule_calculated_at = dt_util.utcnow()
             self._schedule = {
-                "calculated_at": dt_util.now().isoformat(),
+                "calculated_at": dt_util.as_local(self._schedule_calculated_at).isoformat(),
                 "zones": zone_schedule,
-                "total_runtime": sum(z.get("duration_minutes", 0) for z in zone_schedule),
-                "zones_to_water": len([z for z in zone_schedule if z.get("duration_minutes", 0) > 0]),
+                "total_runtime": total_runtime,
+                "zones_to_water": zones_to_water,
             }
 
-            # Calculate next run time
+            # Calculate next run time against the new runtime totals
+            self._upcoming_runs = []
             self._next_run = self._calculate_next_run_time()
-            self._schedule["next_run"] = self._next_run.isoformat() if self._next_run else None
+            self._next_run_iso = self._next_run.isoformat() if self._next_run else None
+            self._schedule["next_run"] = self._next_run_iso
+            self._generation += 1
+            self._async_schedule_save()
 
             _LOGGER.info(
                 "Schedule calculated: %d zones, %d minutes total, next run: %s",
@@ -215,64 +454,102 @@ class SmartScheduler:
             _LOGGER.error("Error calculating schedule: %s", err)
             return {}
 
-    def _calculate_next_run_time(self) -> datetime | None:
-        """Calculate the next scheduled run time.
-
-        For 'start_at' mode: returns when irrigation should start
-        For 'finish_by' mode: returns when irrigation should start
-            (calculated by subtracting estimated runtime from finish time)
-        """
-        now = dt_util.now()
+    def _build_upcoming_runs(self, now: datetime) -> list[datetime]:
+        """Build the sorted run times for the next UPCOMING_RUN_WEEKS weeks.
 
-        # Check rain delay
-        if self._rain_delay_until and now < self._rain_delay_until:
-            return self._rain_delay_until
+        Args:
+            now: Current local time
 
+        Returns:
+            Run start times, earliest first
+        """
         # Get estimated total runtime for finish_by calculation
-        total_runtime_minutes = self._schedule.get("total_runtime", 60)
-
-        # Find next valid watering day
-        for days_ahead in range(8):  # Check up to a week ahead
-            check_date = now.date() + timedelta(days=days_ahead)
-            weekday = check_date.weekday()
+        finish_by_runtime = None
+        if self._schedule_mode == SCHEDULE_MODE_FINISH_BY:
+            finish_by_runtime = timedelta(minutes=self._schedule.get("total_runtime", 60))
+
+        # Days until each watering day, nearest first. Rotating the sorted
+        # weekdays at today's position keeps the offsets in ascending order.
+        today = now.date()
+        base_ordinal = today.toordinal()
+        base_weekday = today.weekday()
+        days = self._watering_days
+        split = bisect_left(days, base_weekday)
+        week = [(day - base_weekday) % 7 for day in days[split:] + days[:split]]
+
+        runs = []
+        for week_start in range(0, 7 * UPCOMING_RUN_WEEKS, 7):
+            for days_ahead in week:
+                check_date = date.fromordinal(base_ordinal + week_start + days_ahead)
 
-            if weekday in self._watering_days:
                 # Get the scheduled time for this date (handles sun events dynamically)
                 scheduled_time = self._get_scheduled_time(check_date)
 
                 if scheduled_time is None:
                     continue
 
-                # Make it timezone-aware
+                # Naive times are local wall-clock times; attach the zone
                 if scheduled_time.tzinfo is None:
-                    scheduled_time = dt_util.as_local(scheduled_time)
+                    scheduled_time = scheduled_time.replace(
+                        tzinfo=dt_util.DEFAULT_TIME_ZONE
+                    )
 
                 # For finish_by mode, subtract runtime to get start time
-                if self._schedule_mode == SCHEDULE_MODE_FINISH_BY:
-                    run_datetime = scheduled_time - timedelta(minutes=total_runtime_minutes)
-                else:
-                    run_datetime = scheduled_time
-
-                # Check if this time is in the future
-                if run_datetime > now:
-                    _LOGGER.debug(
-                        "Next run calculated: %s (mode: %s, sun_event: %s)",
-                        run_datetime,
-                        self._schedule_mode,
-                        self._schedule_sun_event,
-                    )
-                    return run_datetime
+                if finish_by_runtime is not None:
+                    scheduled_time -= finish_by_runtime
+
+                runs.append(scheduled_time)
+
+        # Dates are visited in ascending order, so runs is already sorted
+        return runs
+
+    def _calculate_next_run_time(self) -> datetime | None:
+        """Calculate the next scheduled run time.
+
+        For 'start_at' mode: returns when irrigation should start
+        For 'finish_by' mode: returns when irrigation should start
+            (calculated by subtracting estimated runtime from finish time)
+        """
+        now = dt_util.now()
+
+        # Check rain delay
+        if self._rain_delay_until and now < self._rain_delay_until:
+            return self._rain_delay_until
+
+        # First upcoming run strictly after now; rebuild once exhausted
+        upcoming = self._upcoming_runs
+        index = bisect_right(upcoming, now)
+        if index == len(upcoming):
+            upcoming = self._upcoming_runs = self._build_upcoming_runs(now)
+            index = bisect_right(upcoming, now)
+
+        if index < len(upcoming):
+            run_datetime = upcoming[index]
+            _LOGGER.debug(
+                "Next run calculated: %s (mode: %s, sun_event: %s)",
+                run_datetime,
+                self._schedule_mode,
+                self._schedule_sun_event,
+            )
+            return run_datetime
 
         return None
 
     async def _schedule_next_run(self) -> None:
         """Schedule the next watering run."""
+        # Keep a next run that is still ahead (e.g. from async_calculate_schedule)
+        if self._next_run is None or self._next_run <= dt_util.now():
+            self._next_run = self._calculate_next_run_time()
+            self._next_run_iso = self._next_run.isoformat() if self._next_run else None
+            self._generation += 1
+
         if self._unsub_timer:
+            if self._next_run == self._scheduled_for:
+                # Timer is already armed for this run time
+                return
             self._unsub_timer()
             self._unsub_timer = None
-
-        if self._next_run is None:
-            self._next_run = self._calculate_next_run_time()
+            self._scheduled_for = None
 
         if self._next_run:
             self._unsub_timer = async_track_point_in_time(
@@ -280,11 +557,15 @@ class SmartScheduler:
                 self._async_run_callback,
                 self._next_run,
             )
+            self._scheduled_for = self._next_run
             _LOGGER.debug("Next run scheduled for %s", self._next_run)
 
     @callback
     def _async_run_callback(self, now: datetime) -> None:
         """Callback for scheduled run."""
+        # The timer has fired, so the next call must arm a new one
+        self._unsub_timer = None
+        self._scheduled_for = None
         self.hass.async_create_task(self.async_execute_schedule())
 
     async def async_execute_schedule(self) -> bool:
@@ -298,20 +579,28 @@ class SmartScheduler:
             True if execution started successfully
         """
         _LOGGER.info("Executing irrigation schedule - making AI decision")
-        today = date.today()
+        try:
+            return await self._async_execute_schedule()
+        finally:
+            # Every outcome, including errors, reschedules exactly once
+            self._is_running = False
+            await self._schedule_next_run()
+
+    async def _async_execute_schedule(self) -> bool:
+        """Decide on and dispatch the current schedule, without rescheduling."""
+        now = dt_util.now()
+        today = now.date()
 
         # Check manual skip conditions first
         if self._skip_next:
             _LOGGER.info("Skipping scheduled run (manual skip)")
             self._skip_next = False
             self._record_decision(today, "skipped", "Manual skip requested")
-            await self._schedule_next_run()
             return False
 
-        if self._rain_delay_until and dt_util.now() < self._rain_delay_until:
+        if self._rain_delay_until and dt_util.utcnow() < self._rain_delay_until:
             _LOGGER.info("Skipping scheduled run (rain delay)")
             self._record_decision(today, "skipped", "Rain delay active")
-            await self._schedule_next_run()
             return False
 
         # IMPORTANT: Make a fresh AI decision right now
@@ -329,7 +618,6 @@ class SmartScheduler:
                 ai_decision.get("reason", "AI determined watering not needed"),
                 ai_decision
             )
-            await self._schedule_next_run()
             return False
 
         _LOGGER.info(
@@ -341,53 +629,67 @@ class SmartScheduler:
         # Record the positive decision
         self._record_decision(today, "watering", "AI approved watering", ai_decision)
 
-        # Recalculate schedule with fresh data
-        await self.async_calculate_schedule()
+        # Recalculate schedule with fresh data unless it was just calculated
+        if (
+            self._schedule_calculated_at is None
+            or dt_util.utcnow() - self._schedule_calculated_at >= SCHEDULE_FRESH_WINDOW
+        ):
+            await self.async_calculate_schedule()
 
         zones = self._schedule.get("zones", [])
         if not zones:
             _LOGGER.info("No zones to water after recalculation")
-            await self._schedule_next_run()
             return False
 
         self._is_running = True
-        self._last_run = dt_util.now()
+        self._last_run = now
+        self._last_run_iso = now.isoformat()
 
         try:
             # Build zone list for Rachio
             zones_to_run = []
+            total_seconds = 0
             for zone_info in zones:
-                if zone_info.get("duration_minutes", 0) > 0:
+                if zone_info["duration_minutes"] > 0:
                     # Handle cycle/soak if enabled
-                    if self._cycle_soak_enabled and zone_info.get("cycles"):
+                    if self._cycle_soak_enabled and zone_info["cycles"]:
                         # Run each cycle
                         for cycle in zone_info["cycles"]:
+                            duration = cycle["cycle_seconds"]
                             zones_to_run.append({
                                 "id": zone_info["zone_id"],
-                                "duration": cycle["cycle"] * 60,  # Convert to seconds
+                                "duration": duration,
                             })
+                            total_seconds += duration
                     else:
+                        duration = zone_info["duration_seconds"]
                         zones_to_run.append({
                             "id": zone_info["zone_id"],
-                            "duration": zone_info["duration_minutes"] * 60,
+                            "duration": duration,
                         })
+                        total_seconds += duration
 
             if zones_to_run:
                 success = await self.rachio_api.async_run_multiple_zones(zones_to_run)
 
                 # Record history
+                self._run_history_list = None
                 self._run_history.append({
-                    "timestamp": self._last_run.isoformat(),
+                    "timestamp": self._last_run_iso,
                     "zones": len(zones_to_run),
-                    "total_duration": sum(z["duration"] for z in zones_to_run) // 60,
+                    "total_duration": total_seconds // 60,
                     "success": success,
-                    "schedule": self._schedule.copy(),
+                    # Only the totals are kept so old zone lists can be freed
+                    "schedule": {
+                        "zones_to_water": self._schedule.get("zones_to_water"),
+                        "total_runtime": self._schedule.get("total_runtime"),
+                        "calculated_at": self._schedule.get("calculated_at"),
+                    },
                     "ai_decision": ai_decision,
                 })
-
-                # Keep only last 30 runs
-                if len(self._run_history) > 30:
-                    self._run_history = self._run_history[-30:]
+                self._run_history_ts.append(self._last_run)
+                self._generation += 1
+                self._async_schedule_save()
 
                 return success
 
@@ -395,12 +697,6 @@ class SmartScheduler:
             _LOGGER.error("Error executing schedule: %s", err)
             return False
 
-        finally:
-            self._is_running = False
-            # Schedule next run
-            self._next_run = None
-            await self._schedule_next_run()
-
         return False
 
     async def _make_daily_ai_decision(self) -> dict[str, Any]:
@@ -415,18 +711,17 @@ class SmartScheduler:
         try:
             # Get fresh recommendations from AI model
             recommendations = await self.ai_model.async_get_all_recommendations()
+            self._decision_recommendations = recommendations
+            self._decision_recommendations_time = self.hass.loop.time()
 
-            # Count zones that need water
-            zones_needing_water = [
-                r for r in recommendations.values()
-                if r.should_water and r.duration_minutes > 0
-            ]
-
-            # Calculate aggregate factors
+            # Count zones that need water and aggregate factors in one pass
+            zones_needing_water = 0
             total_confidence = 0
             skip_reasons = []
 
-            for zone_id, rec in recommendations.items():
+            for rec in recommendations.values():
+                if rec.should_water and rec.duration_minutes > 0:
+                    zones_needing_water += 1
                 if rec.skip_reason:
                     skip_reasons.append(f"{rec.zone_name}: {rec.skip_reason}")
                 total_confidence += rec.confidence
@@ -437,12 +732,12 @@ class SmartScheduler:
             model_status = self.ai_model.get_model_status()
 
             # Make the decision
-            should_water = len(zones_needing_water) > 0
+            should_water = zones_needing_water > 0
 
             decision = {
                 "timestamp": dt_util.now().isoformat(),
                 "should_water": should_water,
-                "zones_to_water": len(zones_needing_water),
+                "zones_to_water": zones_needing_water,
                 "total_zones": len(recommendations),
                 "confidence": avg_confidence,
                 "skip_reasons": skip_reasons,
@@ -472,27 +767,26 @@ class SmartScheduler:
     def _generate_decision_reason(
         self,
         should_water: bool,
-        zones_needing_water: list,
+        zones_needing_water: int,
         skip_reasons: list[str],
         model_status: dict[str, Any],
     ) -> str:
         """Generate a human-readable reason for the AI decision."""
         if should_water:
-            zone_count = len(zones_needing_water)
-            return f"{zone_count} zone(s) need water based on current conditions"
+            return f"{zones_needing_water} zone(s) need water based on current conditions"
 
         # Build skip reason
         reasons = []
 
         # Check weather
-        weather = model_status.get("weather_status", {})
-        if weather.get("condition") in ("rainy", "pouring"):
+        weather = model_status.get("weather_status") or EMPTY_MAPPING
+        if weather.get("condition") in _RAINY_CONDITIONS:
             reasons.append("Currently raining")
         if weather.get("precip_forecast", 0) > 0.5:
             reasons.append("Rain expected")
 
         # Check rain sensor
-        rain = model_status.get("rain_status", {})
+        rain = model_status.get("rain_status") or EMPTY_MAPPING
         if rain.get("tripped"):
             reasons.append("Rain sensor triggered")
 
@@ -510,19 +804,18 @@ class SmartScheduler:
         details: dict[str, Any] | None = None,
     ) -> None:
         """Record a watering decision for history tracking."""
+        now = dt_util.now()
         record = {
             "date": decision_date.isoformat(),
-            "timestamp": dt_util.now().isoformat(),
+            "timestamp": now.isoformat(),
             "type": decision_type,  # "watering", "skipped", "ai_skipped"
             "reason": reason,
             "details": details or {},
         }
 
         self._decision_history.append(record)
-
-        # Keep last 60 days of decisions
-        if len(self._decision_history) > 60:
-            self._decision_history = self._decision_history[-60:]
+        self._decision_history_ts.append(now)
+        self._generation += 1
 
         _LOGGER.debug("Recorded decision: %s - %s", decision_type, reason)
 
@@ -561,11 +854,17 @@ class SmartScheduler:
             zone_id: Specific zone to skip, or None for all
         """
         if zone_id:
-            # Mark specific zone as skipped
+            # Mark specific zone as skipped. Build a new schedule rather than
+            # mutating the current one, which run history may reference.
+            zones = []
             for zone in self._schedule.get("zones", []):
                 if zone.get("zone_id") == zone_id:
-                    zone["skipped"] = True
+                    zone = {**zone, "skipped": True}
                     _LOGGER.info("Skipping zone %s for next run", zone_id)
+                zones.append(zone)
+            self._schedule = {**self._schedule, "zones": zones}
+            self._generation += 1
+            self._async_schedule_save()
         else:
             # Skip entire next run
             self._skip_next = True
@@ -577,7 +876,10 @@ class SmartScheduler:
         Args:
             hours: Number of hours to delay
         """
-        self._rain_delay_until = dt_util.now() + timedelta(hours=hours)
+        # Stored in UTC; comparisons against aware local times stay correct
+        self._rain_delay_until = dt_util.utcnow() + timedelta(hours=hours)
+        self._rain_delay_until_iso = self._rain_delay_until.isoformat()
+        self._async_schedule_save()
         _LOGGER.info("Rain delay set until %s", self._rain_delay_until)
 
         # Also set on Rachio device
@@ -590,6 +892,8 @@ class SmartScheduler:
     async def async_cancel_rain_delay(self) -> None:
         """Cancel any active rain delay."""
         self._rain_delay_until = None
+        self._rain_delay_until_iso = None
+        self._async_schedule_save()
         await self.rachio_api.async_cancel_rain_delay()
         _LOGGER.info("Rain delay cancelled")
 
@@ -601,13 +905,13 @@ class SmartScheduler:
         """Get current schedule information."""
         return {
             "schedule": self._schedule,
-            "next_run": self._next_run.isoformat() if self._next_run else None,
-            "last_run": self._last_run.isoformat() if self._last_run else None,
+            "next_run": self._next_run_iso,
+            "last_run": self._last_run_iso,
             "is_running": self._is_running,
             "current_zone": self._current_zone,
             "skip_next": self._skip_next,
-            "rain_delay_until": self._rain_delay_until.isoformat() if self._rain_delay_until else None,
-            "watering_days": self._watering_days,
+            "rain_delay_until": self._rain_delay_until_iso,
+            "watering_days": list(self._watering_days),
             "schedule_mode": self._schedule_mode,
             "schedule_time": self._schedule_time,
             "schedule_sun_event": self._schedule_sun_event,
@@ -616,18 +920,86 @@ class SmartScheduler:
         }
 
     def get_run_history(self) -> list[dict[str, Any]]:
-        """Get watering run history."""
-        return self._run_history.copy()
+        """Get watering run history.
+
+        The same list is returned until the next run is recorded, so
+        repeated websocket polls do not copy the history again. Callers
+        must not mutate it.
+        """
+        if self._run_history_list is None:
+            self._run_history_list = list(self._run_history)
+        return self._run_history_list
 
     def get_decision_history(self) -> list[dict[str, Any]]:
         """Get AI decision history."""
-        return self._decision_history.copy()
+        return list(self._decision_history)
+
+    @staticmethod
+    def _history_between(
+        timestamps: deque[datetime],
+        history: deque[dict[str, Any]],
+        start: datetime,
+        end: datetime,
+    ) -> list[tuple[datetime, dict[str, Any]]]:
+        """Slice an append-ordered history to entries within [start, end]."""
+        lo = bisect_left(timestamps, start)
+        hi = bisect_right(timestamps, end, lo)
+        return list(zip(islice(timestamps, lo, hi), islice(history, lo, hi)))
+
+    def get_run_history_between(
+        self, start: datetime, end: datetime
+    ) -> list[tuple[datetime, dict[str, Any]]]:
+        """Get runs whose timestamp falls within [start, end].
+
+        Returns:
+            List of (timestamp, run) tuples
+        """
+        return self._history_between(
+            self._run_history_ts, self._run_history, start, end
+        )
+
+    def get_decision_history_between(
+        self, start: datetime, end: datetime
+    ) -> list[tuple[datetime, dict[str, Any]]]:
+        """Get decisions whose timestamp falls within [start, end].
+
+        Returns:
+            List of (timestamp, decision) tuples
+        """
+        return self._history_between(
+            self._decision_history_ts, self._decision_history, start, end
+        )
 
     @property
     def daily_decision(self) -> dict[str, Any]:
         """Get today's AI decision."""
         return self._daily_decision
 
+    @property
+    def generation(self) -> int:
+        """Counter that changes whenever schedule or history data changes."""
+        return self._generation
+
+    @property
+    def watering_days(self) -> tuple[int, ...]:
+        """Get the sorted weekdays to water on (Monday=0)."""
+        return self._watering_days
+
+    @property
+    def rain_delay_until(self) -> datetime | None:
+        """Get the end of the current rain delay, if one was set."""
+        return self._rain_delay_until
+
+    @property
+    def has_events(self) -> bool:
+        """Check if there is a run, decision or rain delay to show."""
+        return bool(
+            self._next_run
+            or self._run_history
+            or self._decision_history
+            or self._rain_delay_until
+        )
+
     @property
     def is_running(self) -> bool:
         """Check if scheduler is currently running zones."""
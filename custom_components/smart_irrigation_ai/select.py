@@ -2,19 +2,65 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, ZONE_TYPES, SOIL_TYPES, NOZZLE_TYPES, SUN_EXPOSURE, SLOPE_TYPES
+from .const import (
+    DOMAIN,
+    EMPTY_MAPPING,
+    ZONE_TYPES,
+    SOIL_TYPES,
+    NOZZLE_TYPES,
+    SUN_EXPOSURE,
+    SLOPE_TYPES,
+)
+from .entity import device_info_for
 
 _LOGGER = logging.getLogger(__name__)
 
+# Option lists shared by every zone's select entities; never mutate
+_ZONE_TYPE_OPTIONS = list(ZONE_TYPES)
+_SOIL_TYPE_OPTIONS = list(SOIL_TYPES)
+_NOZZLE_TYPE_OPTIONS = list(NOZZLE_TYPES)
+_SUN_EXPOSURE_OPTIONS = list(SUN_EXPOSURE)
+_SLOPE_OPTIONS = list(SLOPE_TYPES)
+
+_WATERING_MODE_DESCRIPTIONS = {
+    "automatic": "AI determines optimal watering based on all inputs",
+    "eco": "Water conservation mode - reduced watering, higher thresholds",
+    "aggressive": "Maximum growth mode - more frequent, deeper watering",
+    "manual_only": "No automatic scheduling, manual control only",
+    "disabled": "All watering disabled",
+}
+
+
+def _option_attributes(
+    options: Mapping[str, Mapping[str, Any]], fields: Mapping[str, str]
+) -> Mapping[str, Mapping[str, Any]]:
+    """Build the read-only attributes of every option of a zone setting.
+
+    Args:
+        options: Option table from const, e.g. SOIL_TYPES
+        fields: Attribute name -> key in each option's entry
+
+    Returns:
+        Option -> attributes, shared by every zone's entity
+    """
+    return MappingProxyType({
+        option: MappingProxyType({
+            "display_name": info.get("name", option),
+            **{attribute: info.get(key) for attribute, key in fields.items()},
+        })
+        for option, info in options.items()
+    })
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -67,22 +113,15 @@ class SmartIrrigationSelectBase(CoordinatorEntity, SelectEntity):
         self._entity_type = entity_type
         self._attr_name = f"Smart Irrigation {name}"
         self._attr_unique_id = f"{entry.entry_id}_{entity_type}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name="Smart Irrigation AI Controller",
-            manufacturer="Smart Irrigation AI",
-            model="AI Irrigation Controller",
-            sw_version="1.0.0",
-        )
+        self._ai_model = coordinator.hass.data[DOMAIN][entry.entry_id]["ai_model"]
+        self._attr_device_info = device_info_for(entry)
 
 
 class WateringModeSelect(SmartIrrigationSelectBase):
     """Select entity for watering mode."""
 
+    _attr_icon = "mdi:cog"
+
     def __init__(self, coordinator, entry: ConfigEntry) -> None:
         """Initialize the select entity."""
         super().__init__(coordinator, entry, "watering_mode", "Watering Mode")
@@ -93,7 +132,6 @@ class WateringModeSelect(SmartIrrigationSelectBase):
             "manual_only",
             "disabled",
         ]
-        self._attr_icon = "mdi:cog"
         self._current_option = "automatic"
 
     @property
@@ -105,9 +143,6 @@ class WateringModeSelect(SmartIrrigationSelectBase):
         """Set the option."""
         self._current_option = option
 
-        # Adjust AI model behavior based on mode
-        ai_model = self.hass.data[DOMAIN][self._entry.entry_id]["ai_model"]
-
         # Mode adjustments could be applied here
         # For now, just store the selection
         self.async_write_ha_state()
@@ -115,22 +150,20 @@ class WateringModeSelect(SmartIrrigationSelectBase):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        mode_descriptions = {
-            "automatic": "AI determines optimal watering based on all inputs",
-            "eco": "Water conservation mode - reduced watering, higher thresholds",
-            "aggressive": "Maximum growth mode - more frequent, deeper watering",
-            "manual_only": "No automatic scheduling, manual control only",
-            "disabled": "All watering disabled",
-        }
-
         return {
-            "description": mode_descriptions.get(self._current_option, ""),
+            "description": _WATERING_MODE_DESCRIPTIONS.get(self._current_option, ""),
         }
 
 
 class ZoneTypeSelect(SmartIrrigationSelectBase):
     """Select entity for zone vegetation type."""
 
+    _attr_icon = "mdi:grass"
+    _attr_options = _ZONE_TYPE_OPTIONS
+    _attributes_by_option = _option_attributes(
+        ZONE_TYPES, {"crop_coefficient": "kc", "typical_root_depth": "root_depth"}
+    )
+
     def __init__(
         self,
         coordinator,
@@ -147,8 +180,6 @@ class ZoneTypeSelect(SmartIrrigationSelectBase):
         )
         self._zone_id = zone_id
         self._zone_name = zone_name
-        self._attr_options = list(ZONE_TYPES.keys())
-        self._attr_icon = "mdi:grass"
         self._current_option = "cool_season_grass"
 
     @property
@@ -163,26 +194,28 @@ class ZoneTypeSelect(SmartIrrigationSelectBase):
         self._current_option = option
 
         # Update the AI model's zone configuration
-        ai_model = self.hass.data[DOMAIN][self._entry.entry_id]["ai_model"]
-        if self._zone_id in ai_model._zone_configs:
-            ai_model._zone_configs[self._zone_id].zone_type = option
+        self._ai_model.set_zone_option(self._zone_id, "zone_type", option)
 
         self.async_write_ha_state()
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return additional attributes."""
-        zone_info = ZONE_TYPES.get(self._current_option, {})
-        return {
-            "display_name": zone_info.get("name", self._current_option),
-            "crop_coefficient": zone_info.get("kc"),
-            "typical_root_depth": zone_info.get("root_depth"),
-        }
+        return self._attributes_by_option.get(self._current_option, EMPTY_MAPPING)
 
 
 class ZoneSoilTypeSelect(SmartIrrigationSelectBase):
     """Select entity for zone soil type."""
 
+    _attr_icon = "mdi:terrain"
+    _attr_options = _SOIL_TYPE_OPTIONS
+    _attributes_by_option = _option_attributes(
+        SOIL_TYPES, {
+            "infiltration_rate": "infiltration_rate",
+            "water_holding_capacity": "water_holding_capacity",
+        }
+    )
+
     def __init__(
         self,
         coordinator,
@@ -199,8 +232,6 @@ class ZoneSoilTypeSelect(SmartIrrigationSelectBase):
         )
         self._zone_id = zone_id
         self._zone_name = zone_name
-        self._attr_options = list(SOIL_TYPES.keys())
-        self._attr_icon = "mdi:terrain"
         self._current_option = "loam"
 
     @property
@@ -214,26 +245,25 @@ class ZoneSoilTypeSelect(SmartIrrigationSelectBase):
         """Set the option."""
         self._current_option = option
 
-        ai_model = self.hass.data[DOMAIN][self._entry.entry_id]["ai_model"]
-        if self._zone_id in ai_model._zone_configs:
-            ai_model._zone_configs[self._zone_id].soil_type = option
+        self._ai_model.set_zone_option(self._zone_id, "soil_type", option)
 
         self.async_write_ha_state()
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return additional attributes."""
-        soil_info = SOIL_TYPES.get(self._current_option, {})
-        return {
-            "display_name": soil_info.get("name", self._current_option),
-            "infiltration_rate": soil_info.get("infiltration_rate"),
-            "water_holding_capacity": soil_info.get("water_holding_capacity"),
-        }
+        return self._attributes_by_option.get(self._current_option, EMPTY_MAPPING)
 
 
 class ZoneNozzleTypeSelect(SmartIrrigationSelectBase):
     """Select entity for zone nozzle type."""
 
+    _attr_icon = "mdi:sprinkler-fire"
+    _attr_options = _NOZZLE_TYPE_OPTIONS
+    _attributes_by_option = _option_attributes(
+        NOZZLE_TYPES, {"precipitation_rate": "precip_rate"}
+    )
+
     def __init__(
         self,
         coordinator,
@@ -250,8 +280,6 @@ class ZoneNozzleTypeSelect(SmartIrrigationSelectBase):
         )
         self._zone_id = zone_id
         self._zone_name = zone_name
-        self._attr_options = list(NOZZLE_TYPES.keys())
-        self._attr_icon = "mdi:sprinkler-fire"
         self._current_option = "fixed_spray"
 
     @property
@@ -265,25 +293,25 @@ class ZoneNozzleTypeSelect(SmartIrrigationSelectBase):
         """Set the option."""
         self._current_option = option
 
-        ai_model = self.hass.data[DOMAIN][self._entry.entry_id]["ai_model"]
-        if self._zone_id in ai_model._zone_configs:
-            ai_model._zone_configs[self._zone_id].nozzle_type = option
+        self._ai_model.set_zone_option(self._zone_id, "nozzle_type", option)
 
         self.async_write_ha_state()
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return additional attributes."""
-        nozzle_info = NOZZLE_TYPES.get(self._current_option, {})
-        return {
-            "display_name": nozzle_info.get("name", self._current_option),
-            "precipitation_rate": nozzle_info.get("precip_rate"),
-        }
+        return self._attributes_by_option.get(self._current_option, EMPTY_MAPPING)
 
 
 class ZoneSunExposureSelect(SmartIrrigationSelectBase):
     """Select entity for zone sun exposure."""
 
+    _attr_icon = "mdi:white-balance-sunny"
+    _attr_options = _SUN_EXPOSURE_OPTIONS
+    _attributes_by_option = _option_attributes(
+        SUN_EXPOSURE, {"et_factor": "et_factor"}
+    )
+
     def __init__(
         self,
         coordinator,
@@ -300,8 +328,6 @@ class ZoneSunExposureSelect(SmartIrrigationSelectBase):
         )
         self._zone_id = zone_id
         self._zone_name = zone_name
-        self._attr_options = list(SUN_EXPOSURE.keys())
-        self._attr_icon = "mdi:white-balance-sunny"
         self._current_option = "full_sun"
 
     @property
@@ -315,25 +341,25 @@ class ZoneSunExposureSelect(SmartIrrigationSelectBase):
         """Set the option."""
         self._current_option = option
 
-        ai_model = self.hass.data[DOMAIN][self._entry.entry_id]["ai_model"]
-        if self._zone_id in ai_model._zone_configs:
-            ai_model._zone_configs[self._zone_id].sun_exposure = option
+        self._ai_model.set_zone_option(self._zone_id, "sun_exposure", option)
 
         self.async_write_ha_state()
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return additional attributes."""
-        sun_info = SUN_EXPOSURE.get(self._current_option, {})
-        return {
-            "display_name": sun_info.get("name", self._current_option),
-            "et_factor": sun_info.get("et_factor"),
-        }
+        return self._attributes_by_option.get(self._current_option, EMPTY_MAPPING)
 
 
 class ZoneSlopeSelect(SmartIrrigationSelectBase):
     """Select entity for zone slope."""
 
+    _attr_icon = "mdi:slope-uphill"
+    _attr_options = _SLOPE_OPTIONS
+    _attributes_by_option = _option_attributes(
+        SLOPE_TYPES, {"runoff_factor": "runoff_factor"}
+    )
+
     def __init__(
         self,
         coordinator,
@@ -350,8 +376,6 @@ class ZoneSlopeSelect(SmartIrrigationSelectBase):
         )
         self._zone_id = zone_id
         self._zone_name = zone_name
-        self._attr_options = list(SLOPE_TYPES.keys())
-        self._attr_icon = "mdi:slope-uphill"
         self._current_option = "flat"
 
     @property
@@ -365,17 +389,11 @@ class ZoneSlopeSelect(SmartIrrigationSelectBase):
         """Set the option."""
         self._current_option = option
 
-        ai_model = self.hass.data[DOMAIN][self._entry.entry_id]["ai_model"]
-        if self._zone_id in ai_model._zone_configs:
-            ai_model._zone_configs[self._zone_id].slope = option
+        self._ai_model.set_zone_option(self._zone_id, "slope", option)
 
         self.async_write_ha_state()
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return additional attributes."""
-        slope_info = SLOPE_TYPES.get(self._current_option, {})
-        return {
-            "display_name": slope_info.get("name", self._current_option),
-            "runoff_factor": slope_info.get("runoff_factor"),
-        }
+        return self._attributes_by_option.get(self._current_option, EMPTY_MAPPING)
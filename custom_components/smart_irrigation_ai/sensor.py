@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -12,15 +14,28 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, UnitOfTime
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, ATTR_NEXT_RUN, ATTR_AI_CONFIDENCE
+from .const import DOMAIN, ATTR_NEXT_RUN, ATTR_AI_CONFIDENCE, EMPTY_MAPPING
+from .coordinator import EMPTY_ZONE_DATA
+from .entity import SkipUnchangedMixin, device_info_for
 
 _LOGGER = logging.getLogger(__name__)
 
+# Assumed zone area in square feet when estimating water usage
+DEFAULT_ZONE_AREA_SQFT = 1000
+# 1 inch of water over 1 sqft = 0.623 gallons, folded with the default area
+GALLONS_PER_ZONE_INCH = DEFAULT_ZONE_AREA_SQFT * 0.623
+
+
+# Skip reasons come from a small fixed set, so their slugs are memoized
+@lru_cache(maxsize=64)
+def _slugify_skip(reason: str) -> str:
+    """Return the state suffix for a skip reason."""
+    return reason.lower().replace(' ', '_')[:20]
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -32,41 +47,38 @@ async def async_setup_entry(
     coordinator = data["coordinator"]
     zones_info = data.get("zones_info", [])
 
-    entities = []
-
-    # Main controller sensors
-    entities.extend([
-        IrrigationStatusSensor(coordinator, entry),
-        NextRunSensor(coordinator, entry),
-        WeatherFactorSensor(coordinator, entry),
-        SeasonalFactorSensor(coordinator, entry),
-        TotalWaterUsageSensor(coordinator, entry),
-    ])
-
-    # Zone-specific sensors
+    # Resolve and validate each zone once, not once per entity class
+    valid_zones = []
     for zone in zones_info:
         zone_id = zone.get("zone_id") or zone.get("entity_id")
+        if not zone_id:
+            _LOGGER.warning("Skipping zone sensor creation - no valid zone ID: %s", zone)
+            continue
+
         zone_name = zone.get("name", f"Zone {zone.get('zone_number', '?')}")
         # Ensure zone_name starts with "Zone" for consistent entity naming
         if not zone_name.lower().startswith("zone"):
             zone_name = f"Zone {zone_name}"
+        valid_zones.append((zone_id, zone_name))
 
-        # Skip zones without valid ID
-        if not zone_id:
-            _LOGGER.warning("Skipping zone sensor creation - no valid zone ID: %s", zone)
-            continue
-
-        entities.extend([
-            ZoneMoistureSensor(coordinator, entry, zone_id, zone_name),
-            ZoneRecommendationSensor(coordinator, entry, zone_id, zone_name),
-            ZoneWaterDeficitSensor(coordinator, entry, zone_id, zone_name),
-            ZoneNextDurationSensor(coordinator, entry, zone_id, zone_name),
-        ])
+    entities = [
+        # Main controller sensors
+        IrrigationStatusSensor(coordinator, entry),
+        NextRunSensor(coordinator, entry),
+        WeatherFactorSensor(coordinator, entry),
+        SeasonalFactorSensor(coordinator, entry),
+        TotalWaterUsageSensor(coordinator, entry),
+    ] + [
+        # Zone-specific sensors
+        sensor_cls(coordinator, entry, zone_id, zone_name)
+        for zone_id, zone_name in valid_zones
+        for sensor_cls in _ZONE_SENSOR_CLASSES
+    ]
 
     async_add_entities(entities)
 
 
-class SmartIrrigationSensorBase(CoordinatorEntity, SensorEntity):
+class SmartIrrigationSensorBase(SkipUnchangedMixin, CoordinatorEntity, SensorEntity):
     """Base class for Smart Irrigation sensors."""
 
     def __init__(
@@ -82,113 +94,107 @@ class SmartIrrigationSensorBase(CoordinatorEntity, SensorEntity):
         self._sensor_type = sensor_type
         self._attr_name = f"Smart Irrigation {name}"
         self._attr_unique_id = f"{entry.entry_id}_{sensor_type}"
+        self._attr_device_info = device_info_for(entry)
+        # Derived state, recomputed once per coordinator update
+        self._attr_native_value = None
+        self._attr_extra_state_attributes = EMPTY_MAPPING
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name="Smart Irrigation AI Controller",
-            manufacturer="Smart Irrigation AI",
-            model="AI Irrigation Controller",
-            sw_version="1.0.0",
-        )
+    def _derive(self, data: dict[str, Any] | None) -> tuple[Any, Mapping[str, Any]]:
+        """Compute the sensor value and attributes from coordinator data.
+
+        Args:
+            data: Current coordinator data, or None before the first refresh
+
+        Returns:
+            Tuple of (native value, extra state attributes)
+        """
+        return None, EMPTY_MAPPING
+
+    def _state_input(self) -> tuple[Any, Mapping[str, Any]]:
+        """Recompute the derived state once per coordinator update."""
+        return self._derive(self.coordinator.data)
+
+    def _apply_state_input(self, state_input: tuple[Any, Mapping[str, Any]]) -> None:
+        """Store the derived state for the next state write."""
+        self._attr_native_value, self._attr_extra_state_attributes = state_input
 
 
 class IrrigationStatusSensor(SmartIrrigationSensorBase):
     """Sensor for overall irrigation status."""
 
+    _attr_icon = "mdi:sprinkler-variant"
+
     def __init__(self, coordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "status", "Status")
-        self._attr_icon = "mdi:sprinkler-variant"
-
-    @property
-    def native_value(self) -> str:
-        """Return the status."""
-        if self.coordinator.data is None:
-            return "unknown"
 
-        schedule = self.coordinator.data.get("schedule", {})
+    def _derive(self, data: dict[str, Any] | None) -> tuple[str, Mapping[str, Any]]:
+        """Return the status and attributes."""
+        if data is None:
+            return "unknown", EMPTY_MAPPING
 
-        if schedule.get("rain_delay_until"):
-            return "rain_delay"
-
-        if schedule.get("is_running"):
-            return "running"
-
-        if schedule.get("skip_next"):
-            return "skip_scheduled"
-
-        recommendations = self.coordinator.data.get("recommendations", {})
+        schedule = data.get("schedule", {})
+        recommendations = data.get("recommendations", {})
         zones_needing_water = sum(
             1 for r in recommendations.values()
-            if hasattr(r, 'should_water') and r.should_water
+            if r is not None and r.should_water
         )
 
-        if zones_needing_water > 0:
-            return "scheduled"
-
-        return "idle"
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes."""
-        if self.coordinator.data is None:
-            return {}
-
-        schedule = self.coordinator.data.get("schedule", {})
-        recommendations = self.coordinator.data.get("recommendations", {})
-
-        return {
+        if schedule.get("rain_delay_until"):
+            status = "rain_delay"
+        elif schedule.get("is_running"):
+            status = "running"
+        elif schedule.get("skip_next"):
+            status = "skip_scheduled"
+        elif zones_needing_water > 0:
+            status = "scheduled"
+        else:
+            status = "idle"
+
+        return status, {
             "next_run": schedule.get("next_run"),
             "last_run": schedule.get("last_run"),
-            "zones_scheduled": len([
-                r for r in recommendations.values()
-                if hasattr(r, 'should_water') and r.should_water
-            ]),
+            "zones_scheduled": zones_needing_water,
             "total_runtime_minutes": schedule.get("schedule", {}).get("total_runtime", 0),
             "rain_delay_until": schedule.get("rain_delay_until"),
-            "last_update": self.coordinator.data.get("last_update"),
+            "last_change": self.coordinator.last_change,
         }
 
 
 class NextRunSensor(SmartIrrigationSensorBase):
     """Sensor for next scheduled run."""
 
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_icon = "mdi:calendar-clock"
+
     def __init__(self, coordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "next_run", "Next Run")
-        self._attr_device_class = SensorDeviceClass.TIMESTAMP
-        self._attr_icon = "mdi:calendar-clock"
-
-    @property
-    def native_value(self) -> datetime | None:
-        """Return the next run time."""
-        if self.coordinator.data is None:
-            return None
-
-        schedule = self.coordinator.data.get("schedule", {})
+        # Next run string changes far less often than the coordinator refreshes
+        self._last_next_run_raw: str | None = None
+        self._parsed_next_run: datetime | None = None
+
+    def _derive(
+        self, data: dict[str, Any] | None
+    ) -> tuple[datetime | None, Mapping[str, Any]]:
+        """Return the next run time and attributes."""
+        if data is None:
+            return None, EMPTY_MAPPING
+
+        schedule = data.get("schedule", {})
+        sched_data = schedule.get("schedule", {})
         next_run = schedule.get("next_run")
 
-        if next_run:
-            try:
-                return datetime.fromisoformat(next_run)
-            except (ValueError, TypeError):
-                pass
-
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes."""
-        if self.coordinator.data is None:
-            return {}
+        if next_run != self._last_next_run_raw:
+            self._last_next_run_raw = next_run
+            self._parsed_next_run = None
+            if next_run:
+                try:
+                    self._parsed_next_run = datetime.fromisoformat(next_run)
+                except (ValueError, TypeError):
+                    pass
 
-        schedule = self.coordinator.data.get("schedule", {})
-        sched_data = schedule.get("schedule", {})
-
-        return {
+        return self._parsed_next_run, {
             "zones_to_water": sched_data.get("zones_to_water", 0),
             "total_runtime": sched_data.get("total_runtime", 0),
             "watering_days": schedule.get("watering_days", []),
@@ -198,38 +204,28 @@ class NextRunSensor(SmartIrrigationSensorBase):
 class WeatherFactorSensor(SmartIrrigationSensorBase):
     """Sensor for current weather adjustment factor."""
 
+    _attr_native_unit_of_measurement = None
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:weather-partly-cloudy"
+
     def __init__(self, coordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "weather_factor", "Weather Factor")
-        self._attr_native_unit_of_measurement = None
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_icon = "mdi:weather-partly-cloudy"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the weather factor."""
-        if self.coordinator.data is None:
-            return None
-
-        weather = self.coordinator.data.get("weather", {})
 
-        # Get weather factor from first zone recommendation or weather data
-        recommendations = self.coordinator.data.get("recommendations", {})
-        for rec in recommendations.values():
-            if hasattr(rec, 'factors'):
-                return rec.factors.get("weather_factor")
+    def _derive(
+        self, data: dict[str, Any] | None
+    ) -> tuple[float | None, Mapping[str, Any]]:
+        """Return the weather factor and current weather attributes."""
+        if data is None:
+            return None, EMPTY_MAPPING
 
-        return 1.0
+        # Weather factor is shared by all zones; 1.0 before any recommendation
+        sample_factors = data.get("sample_factors")
+        weather_factor = sample_factors.get("weather_factor") if sample_factors else 1.0
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes."""
-        if self.coordinator.data is None:
-            return {}
-
-        weather = self.coordinator.data.get("weather", {})
-
-        return {
+        # Weather data is only needed for the attributes
+        weather = data.get("weather", {})
+        return weather_factor, {
             "condition": weather.get("condition"),
             "temperature": weather.get("temperature"),
             "humidity": weather.get("humidity"),
@@ -242,62 +238,62 @@ class WeatherFactorSensor(SmartIrrigationSensorBase):
 class SeasonalFactorSensor(SmartIrrigationSensorBase):
     """Sensor for seasonal adjustment factor."""
 
+    _attr_native_unit_of_measurement = None
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:leaf"
+
     def __init__(self, coordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "seasonal_factor", "Seasonal Factor")
-        self._attr_native_unit_of_measurement = None
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_icon = "mdi:leaf"
 
-    @property
-    def native_value(self) -> float | None:
+    def _derive(
+        self, data: dict[str, Any] | None
+    ) -> tuple[float | None, Mapping[str, Any]]:
         """Return the seasonal factor."""
-        recommendations = self.coordinator.data.get("recommendations", {}) if self.coordinator.data else {}
-
-        for rec in recommendations.values():
-            if hasattr(rec, 'factors'):
-                return rec.factors.get("seasonal_factor")
+        sample_factors = data.get("sample_factors") if data else None
+        if sample_factors:
+            return sample_factors.get("seasonal_factor"), EMPTY_MAPPING
 
         # Calculate based on current month
         from .const import SEASONAL_FACTORS
-        return SEASONAL_FACTORS.get(datetime.now().month, 1.0)
+        return SEASONAL_FACTORS.get(datetime.now().month, 1.0), EMPTY_MAPPING
 
 
 class TotalWaterUsageSensor(SmartIrrigationSensorBase):
     """Sensor for total water usage."""
 
+    _attr_native_unit_of_measurement = "gal"
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_icon = "mdi:water"
+
     def __init__(self, coordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "water_usage", "Estimated Water Usage")
-        self._attr_native_unit_of_measurement = "gal"
-        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-        self._attr_icon = "mdi:water"
 
-    @property
-    def native_value(self) -> float | None:
+    def _derive(
+        self, data: dict[str, Any] | None
+    ) -> tuple[float | None, Mapping[str, Any]]:
         """Return estimated water usage in gallons."""
-        if self.coordinator.data is None:
-            return 0
+        if data is None:
+            return 0, EMPTY_MAPPING
 
-        schedule = self.coordinator.data.get("schedule", {}).get("schedule", {})
+        schedule = data.get("schedule", {}).get("schedule", {})
         zones = schedule.get("zones", [])
 
-        # Estimate gallons based on water inches and area
-        # Assume average zone area of 1000 sqft
-        total_gallons = 0
-        for zone in zones:
-            water_inches = zone.get("water_amount_inches", 0)
-            area_sqft = 1000  # Default assumption
-            # 1 inch of water over 1 sqft = 0.623 gallons
-            gallons = water_inches * area_sqft * 0.623
-            total_gallons += gallons
+        # Every zone uses the same assumed area, so scale the summed inches once
+        total_inches = sum(zone["water_amount_inches"] for zone in zones)
 
-        return round(total_gallons, 1)
+        return round(total_inches * GALLONS_PER_ZONE_INCH, 1), EMPTY_MAPPING
 
 
 class ZoneMoistureSensor(SmartIrrigationSensorBase):
     """Sensor for zone soil moisture."""
 
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_device_class = SensorDeviceClass.HUMIDITY
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:water-percent"
+
     def __init__(
         self,
         coordinator,
@@ -314,31 +310,21 @@ class ZoneMoistureSensor(SmartIrrigationSensorBase):
         )
         self._zone_id = zone_id
         self._zone_name = zone_name
-        self._attr_native_unit_of_measurement = PERCENTAGE
-        self._attr_device_class = SensorDeviceClass.HUMIDITY
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_icon = "mdi:water-percent"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the moisture level."""
-        if self.coordinator.data is None:
-            return None
-
-        moisture = self.coordinator.data.get("moisture", {})
-        zone_moisture = moisture.get(self._zone_id, {})
 
-        return zone_moisture.get("value")
+    def _derive(
+        self, data: dict[str, Any] | None
+    ) -> tuple[float | None, Mapping[str, Any]]:
+        """Return the moisture level and soil analysis attributes."""
+        if data is None:
+            return None, EMPTY_MAPPING
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes."""
-        recommendations = self.coordinator.data.get("recommendations", {}) if self.coordinator.data else {}
-        rec = recommendations.get(self._zone_id)
+        zone = data.get("by_zone", {}).get(self._zone_id, EMPTY_ZONE_DATA)
+        value = zone["moisture"].get("value")
 
-        if rec and hasattr(rec, 'factors'):
+        rec = zone["recommendation"]
+        if rec is not None:
             soil_analysis = rec.factors.get("soil_analysis", {})
-            return {
+            return value, {
                 "status": soil_analysis.get("status"),
                 "needs_water": soil_analysis.get("needs_water"),
                 "urgency": soil_analysis.get("urgency"),
@@ -346,12 +332,14 @@ class ZoneMoistureSensor(SmartIrrigationSensorBase):
                 "water_deficit_pct": soil_analysis.get("water_deficit_pct"),
             }
 
-        return {}
+        return value, EMPTY_MAPPING
 
 
 class ZoneRecommendationSensor(SmartIrrigationSensorBase):
     """Sensor for zone AI recommendation."""
 
+    _attr_icon = "mdi:brain"
+
     def __init__(
         self,
         coordinator,
@@ -368,90 +356,49 @@ class ZoneRecommendationSensor(SmartIrrigationSensorBase):
         )
         self._zone_id = zone_id
         self._zone_name = zone_name
-        self._attr_icon = "mdi:brain"
+        # Recommendation the cached attributes were built from
+        self._attrs_rec: Any = None
+        self._rec_attrs: Mapping[str, Any] = EMPTY_MAPPING
 
-    @property
-    def native_value(self) -> str:
-        """Return the recommendation."""
-        if self.coordinator.data is None:
-            return "unknown"
+    def _derive(self, data: dict[str, Any] | None) -> tuple[str, Mapping[str, Any]]:
+        """Return the recommendation and its details."""
+        if data is None:
+            self._attrs_rec = None
+            return "unknown", EMPTY_MAPPING
 
-        recommendations = self.coordinator.data.get("recommendations", {})
-        rec = recommendations.get(self._zone_id)
+        zone = data.get("by_zone", {}).get(self._zone_id, EMPTY_ZONE_DATA)
+        rec = zone["recommendation"]
 
         if rec is None:
-            return "no_data"
-
-        if hasattr(rec, 'should_water'):
-            if rec.should_water:
-                return f"water_{rec.duration_minutes}min"
-            elif rec.skip_reason:
-                return f"skip_{rec.skip_reason.lower().replace(' ', '_')[:20]}"
-            else:
-                return "skip"
-
-        return "unknown"
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes."""
-        recommendations = self.coordinator.data.get("recommendations", {}) if self.coordinator.data else {}
-        rec = recommendations.get(self._zone_id)
-
-        if rec and hasattr(rec, 'to_dict'):
-            return rec.to_dict()
-        elif rec and hasattr(rec, 'factors'):
-            return {
-                "should_water": rec.should_water,
-                "duration_minutes": rec.duration_minutes,
-                "water_amount_inches": rec.water_amount_inches,
-                "confidence": rec.confidence,
-                "priority": rec.priority,
-                "skip_reason": rec.skip_reason,
-                **rec.factors,
-            }
+            self._attrs_rec = None
+            return "no_data", EMPTY_MAPPING
 
-        return {}
+        if rec.should_water:
+            value = f"water_{rec.duration_minutes}min"
+        elif rec.skip_reason:
+            value = f"skip_{_slugify_skip(rec.skip_reason)}"
+        else:
+            value = "skip"
 
+        # The same recommendation object keeps its flattened attributes
+        if rec is not self._attrs_rec:
+            self._attrs_rec = rec
+            self._rec_attrs = rec.to_dict()
 
-class ZoneWaterDeficitSensor(SmartIrrigationSensorBase):
-    """Sensor for zone water deficit."""
+        return value, self._rec_attrs
 
-    def __init__(
-        self,
-        coordinator,
-        entry: ConfigEntry,
-        zone_id: str,
-        zone_name: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(
-            coordinator,
-            entry,
-            f"zone_{zone_id}_deficit",
-            f"{zone_name} Water Deficit",
-        )
-        self._zone_id = zone_id
-        self._zone_name = zone_name
-        self._attr_native_unit_of_measurement = PERCENTAGE
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_icon = "mdi:water-minus"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the water deficit percentage."""
-        recommendations = self.coordinator.data.get("recommendations", {}) if self.coordinator.data else {}
-        rec = recommendations.get(self._zone_id)
 
-        if rec and hasattr(rec, 'factors'):
-            et_status = rec.factors.get("et_status", {})
-            return et_status.get("depletion_percent")
+class ZoneRecommendationSummarySensor(SmartIrrigationSensorBase):
+    """Sensor for zone recommended duration with the water balance details.
 
-        return None
+    Replaces the separate water deficit sensor; the depletion percentage is
+    exposed as an attribute. Keeps the duration sensor's unique ID so the
+    existing entity carries over.
+    """
 
-
-class ZoneNextDurationSensor(SmartIrrigationSensorBase):
-    """Sensor for zone recommended duration."""
+    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:timer-outline"
 
     def __init__(
         self,
@@ -469,17 +416,29 @@ class ZoneNextDurationSensor(SmartIrrigationSensorBase):
         )
         self._zone_id = zone_id
         self._zone_name = zone_name
-        self._attr_native_unit_of_measurement = UnitOfTime.MINUTES
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_icon = "mdi:timer-outline"
 
-    @property
-    def native_value(self) -> int | None:
-        """Return the recommended duration."""
-        recommendations = self.coordinator.data.get("recommendations", {}) if self.coordinator.data else {}
-        rec = recommendations.get(self._zone_id)
+    def _derive(
+        self, data: dict[str, Any] | None
+    ) -> tuple[int | None, Mapping[str, Any]]:
+        """Return the recommended duration and water balance attributes."""
+        by_zone = data.get("by_zone", {}) if data else {}
+        rec = by_zone.get(self._zone_id, EMPTY_ZONE_DATA)["recommendation"]
 
-        if rec and hasattr(rec, 'duration_minutes'):
-            return rec.duration_minutes
+        if rec is None:
+            return None, EMPTY_MAPPING
+
+        et_status = rec.factors.get("et_status", {})
+        return rec.duration_minutes, {
+            "depletion_percent": et_status.get("depletion_percent"),
+            "water_amount_inches": round(rec.water_amount_inches, 3),
+            "confidence": round(rec.confidence, 2),
+            "priority": rec.priority,
+        }
 
-        return None
+
+# Sensors created for every zone, in entity registration order
+_ZONE_SENSOR_CLASSES = (
+    ZoneMoistureSensor,
+    ZoneRecommendationSensor,
+    ZoneRecommendationSummarySensor,
+)
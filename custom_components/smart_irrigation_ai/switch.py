@@ -2,16 +2,18 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, CONF_ZONES
+from .const import DOMAIN, CONF_ZONES, EMPTY_MAPPING
+from .coordinator import EMPTY_ZONE_DATA
+from .entity import SkipUnchangedMixin, device_info_for
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,13 +32,11 @@ async def async_setup_entry(
     config = data.get("config", {})
     zones_config = config.get(CONF_ZONES, {})
 
-    entities = []
-
-    # Main controller switches
-    entities.extend([
+    entities = [
+        # Main controller switches
         SchedulerEnabledSwitch(coordinator, entry, scheduler),
         RainDelaySwitch(coordinator, entry, scheduler),
-    ])
+    ]
 
     # Zone switches
     for zone in zones_info:
@@ -68,7 +68,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class SmartIrrigationSwitchBase(CoordinatorEntity, SwitchEntity):
+class SmartIrrigationSwitchBase(SkipUnchangedMixin, CoordinatorEntity, SwitchEntity):
     """Base class for Smart Irrigation switches."""
 
     def __init__(
@@ -84,27 +84,18 @@ class SmartIrrigationSwitchBase(CoordinatorEntity, SwitchEntity):
         self._switch_type = switch_type
         self._attr_name = f"Smart Irrigation {name}"
         self._attr_unique_id = f"{entry.entry_id}_{switch_type}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name="Smart Irrigation AI Controller",
-            manufacturer="Smart Irrigation AI",
-            model="AI Irrigation Controller",
-            sw_version="1.0.0",
-        )
+        self._attr_device_info = device_info_for(entry)
 
 
 class SchedulerEnabledSwitch(SmartIrrigationSwitchBase):
     """Switch to enable/disable the scheduler."""
 
+    _attr_icon = "mdi:calendar-check"
+
     def __init__(self, coordinator, entry: ConfigEntry, scheduler) -> None:
         """Initialize the switch."""
         super().__init__(coordinator, entry, "scheduler_enabled", "Scheduler")
         self._scheduler = scheduler
-        self._attr_icon = "mdi:calendar-check"
         self._is_on = True
 
     @property
@@ -126,10 +117,10 @@ class SchedulerEnabledSwitch(SmartIrrigationSwitchBase):
         self.async_write_ha_state()
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return additional attributes."""
         if self.coordinator.data is None:
-            return {}
+            return EMPTY_MAPPING
 
         schedule = self.coordinator.data.get("schedule", {})
         return {
@@ -142,11 +133,12 @@ class SchedulerEnabledSwitch(SmartIrrigationSwitchBase):
 class RainDelaySwitch(SmartIrrigationSwitchBase):
     """Switch for rain delay."""
 
+    _attr_icon = "mdi:weather-rainy"
+
     def __init__(self, coordinator, entry: ConfigEntry, scheduler) -> None:
         """Initialize the switch."""
         super().__init__(coordinator, entry, "rain_delay", "Rain Delay")
         self._scheduler = scheduler
-        self._attr_icon = "mdi:weather-rainy"
 
     @property
     def is_on(self) -> bool:
@@ -160,18 +152,25 @@ class RainDelaySwitch(SmartIrrigationSwitchBase):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable 24-hour rain delay."""
         await self._scheduler.async_set_rain_delay(24)
-        await self.coordinator.async_request_refresh()
+        await self._async_refresh_schedule()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Cancel rain delay."""
         await self._scheduler.async_cancel_rain_delay()
-        await self.coordinator.async_request_refresh()
+        await self._async_refresh_schedule()
+
+    async def _async_refresh_schedule(self) -> None:
+        """Publish the new rain delay without a full data refresh."""
+        if self.coordinator.data is None:
+            await self.coordinator.async_request_refresh()
+        else:
+            await self.coordinator.async_refresh_schedule()
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return additional attributes."""
         if self.coordinator.data is None:
-            return {}
+            return EMPTY_MAPPING
 
         schedule = self.coordinator.data.get("schedule", {})
         rain_sensor = self.coordinator.data.get("rain_sensor", {})
@@ -186,6 +185,8 @@ class RainDelaySwitch(SmartIrrigationSwitchBase):
 class ZoneSwitch(SmartIrrigationSwitchBase):
     """Switch for individual zone control."""
 
+    _attr_icon = "mdi:sprinkler"
+
     def __init__(
         self,
         coordinator,
@@ -210,7 +211,6 @@ class ZoneSwitch(SmartIrrigationSwitchBase):
         self._zone_name = zone_name
         self._zone_number = zone_number
         self._zone_config = zone_config or {}
-        self._attr_icon = "mdi:sprinkler"
 
     @property
     def is_on(self) -> bool:
@@ -218,29 +218,47 @@ class ZoneSwitch(SmartIrrigationSwitchBase):
         if self.coordinator.data is None:
             return False
 
-        zones = self.coordinator.data.get("zones", {})
-        zone_status = zones.get(self._zone_id, {})
-
-        return zone_status.get("running", False)
+        zone = self.coordinator.data.get("by_zone", {}).get(
+            self._zone_id, EMPTY_ZONE_DATA
+        )
+        return zone["zone_status"].get("running", False)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Start the zone."""
         # Get AI-recommended duration or default to 10 minutes
-        ai_model = self.hass.data[DOMAIN][self._entry.entry_id]["ai_model"]
-        duration = await ai_model.async_get_recommended_duration(self._zone_id)
+        rec = None
+        if self.coordinator.data is not None:
+            rec = self.coordinator.data.get("by_zone", {}).get(
+                self._zone_id, EMPTY_ZONE_DATA
+            )["recommendation"]
+
+        if rec is not None:
+            # Recommendation from the latest coordinator refresh
+            duration = rec.duration_minutes if rec.should_water else 0
+        else:
+            ai_model = self.hass.data[DOMAIN][self._entry.entry_id]["ai_model"]
+            duration = await ai_model.async_get_recommended_duration(self._zone_id)
+
         if duration <= 0:
             duration = 10  # Default 10 minutes
 
         await self._rachio_api.async_run_zone(self._zone_id, duration * 60)
-        await self.coordinator.async_request_refresh()
+        await self._async_set_running(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Stop the zone."""
         await self._rachio_api.async_stop_zone(self._zone_id)
-        await self.coordinator.async_request_refresh()
+        await self._async_set_running(False)
+
+    async def _async_set_running(self, running: bool) -> None:
+        """Show the new running state without a full data refresh."""
+        if self.coordinator.data is None:
+            await self.coordinator.async_request_refresh()
+        else:
+            self.coordinator.async_set_zone_running(self._zone_id, running)
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return additional attributes."""
         attrs = {
             "zone_id": self._zone_id,
@@ -260,8 +278,10 @@ class ZoneSwitch(SmartIrrigationSwitchBase):
         if self.coordinator.data is None:
             return attrs
 
-        zones = self.coordinator.data.get("zones", {})
-        zone_status = zones.get(self._zone_id, {})
+        zone = self.coordinator.data.get("by_zone", {}).get(
+            self._zone_id, EMPTY_ZONE_DATA
+        )
+        zone_status = zone["zone_status"]
 
         attrs.update({
             "enabled": zone_status.get("enabled", True),
@@ -271,9 +291,8 @@ class ZoneSwitch(SmartIrrigationSwitchBase):
         })
 
         # Add recommendation info
-        recommendations = self.coordinator.data.get("recommendations", {})
-        rec = recommendations.get(self._zone_id)
-        if rec and hasattr(rec, 'should_water'):
+        rec = zone["recommendation"]
+        if rec is not None:
             attrs.update({
                 "ai_should_water": rec.should_water,
                 "ai_duration": rec.duration_minutes,